@@ -1,50 +1,5 @@
-"""Setup script for Portfolio Tracker"""
+"""Setup shim for Portfolio Tracker; all metadata lives in pyproject.toml"""
 
-from setuptools import setup, find_packages
+from setuptools import setup
 
-with open("README.md", "r", encoding="utf-8") as fh:
-    long_description = fh.read()
-
-with open("requirements.txt", "r", encoding="utf-8") as fh:
-    requirements = [line.strip() for line in fh if line.strip() and not line.startswith("#")]
-
-setup(
-    name="portfolio-tracker",
-    version="1.0.0",
-    author="Portfolio Tracker Team",
-    description="A web scraping tool for tracking CardMarket portfolio prices",
-    long_description=long_description,
-    long_description_content_type="text/markdown",
-    url="https://github.com/your-username/portfolio-tracker",
-    packages=find_packages(where="src"),
-    package_dir={"": "src"},
-    classifiers=[
-        "Development Status :: 4 - Beta",
-        "Intended Audience :: End Users/Desktop",
-        "License :: OSI Approved :: MIT License",
-        "Operating System :: OS Independent",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3.11",
-    ],
-    python_requires=">=3.8",
-    install_requires=requirements,
-    extras_require={
-        "dev": [
-            "black>=23.0.0",
-            "flake8>=6.0.0",
-            "mypy>=1.0.0",
-            "pytest>=7.0.0",
-            "pytest-asyncio>=0.21.0",
-        ],
-    },
-    entry_points={
-        "console_scripts": [
-            "portfolio-tracker=portfolio_tracker.main:main",
-        ],
-    },
-    include_package_data=True,
-    zip_safe=False,
-)
\ No newline at end of file
+setup()
@@ -3,24 +3,95 @@
 import os
 import csv
 import json
+import atexit
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 
+try:
+    import numpy as np
+except ImportError:  # Optional; only needed for the columnar analytics view
+    np = None
+
+try:
+    import orjson
+except ImportError:  # Optional fast JSON; stdlib json is the fallback
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Optional columnar mirror; CSV remains the source of truth
+    pa = None
+    pq = None
+
+# Column order for portfolio_items.csv rows
+PORTFOLIO_FIELDS = (
+    'id', 'link', 'name', 'purchase_date', 'quantity',
+    'purchase_price', 'created_at', 'updated_at'
+)
+
+# Column order for price_history.csv rows
+PRICE_HISTORY_FIELDS = (
+    'item_id', 'item_name', 'available_items', 'from_price',
+    'price_trend', 'avg_30_days', 'avg_7_days', 'avg_1_day',
+    'min_seller_price', 'max_seller_price', 'seller_count',
+    'seller_prices_json', 'scrape_status', 'error_message',
+    'scraped_at'
+)
+
 
 class CSVStorageManager:
     """Manages CSV-based storage operations for portfolio tracking"""
-    
-    def __init__(self, data_dir: str = "data"):
+
+    def __init__(self, data_dir: str = "data", flush_every: int = 50,
+                 parquet_mirror: bool = False):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
-        
+
         # CSV file paths
         self.portfolio_file = self.data_dir / "portfolio_items.csv"
         self.price_history_file = self.data_dir / "price_history.csv"
-        
+
+        # Sidecar index for price history lookups (item_id -> byte offsets)
+        self.price_index_file = self.data_dir / "price_history.idx"
+        self._price_index = None
+
+        # Portfolio changes are appended to a redo log and folded into the
+        # snapshot CSV only at compaction time, so a sync writes O(changed
+        # rows) instead of rewriting the whole file
+        self.portfolio_log_file = self.data_dir / "portfolio_log.jsonl"
+        self.compact_after = 100
+
+        # In-memory portfolio items keyed by link, loaded lazily; the CSV is
+        # only rewritten when a sync actually changes something, and the
+        # cache is invalidated by file mtime so external edits are noticed
+        self._portfolio_by_link = None
+        self._portfolio_state = None
+
+        # Buffer price rows in memory and write them in batches so the
+        # append path pays one flush+fsync per batch instead of per row
+        self.flush_every = max(1, flush_every)
+        self._price_buffer: List[Dict[str, Any]] = []
+
+        # Columnar (structure-of-arrays) cache of the price history for
+        # analytics, rebuilt only when the file grows
+        self._price_columns = None
+        self._price_columns_size = None
+
+        # Optional columnar mirror of the price history: much smaller on
+        # disk and far faster for analytics than re-parsing CSV + JSON
+        self.parquet_file = self.data_dir / "price_history.parquet"
+        self.parquet_mirror = parquet_mirror and pq is not None
+        self._parquet_writer = None
+
         # Initialize CSV files if they don't exist
         self._init_csv_files()
+
+        # Buffered rows must survive process exit: direct save_price_data
+        # callers never flush explicitly, so close() runs at interpreter
+        # shutdown to drain the buffer and finalize the Parquet writer
+        atexit.register(self.close)
     
     def _init_csv_files(self):
         """Initialize CSV files with headers if they don't exist"""
@@ -45,34 +116,96 @@ class CSVStorageManager:
                     'scraped_at'
                 ])
     
-    def sync_portfolio_items(self, items: List[Dict[str, Any]]) -> None:
-        """Sync portfolio items from CSV data to storage"""
-        # Read existing items
-        existing_items = {}
-        if self.portfolio_file.exists():
+    def _portfolio_files_state(self):
+        """Staleness token for the snapshot CSV plus redo log"""
+        try:
+            mtime = self.portfolio_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        try:
+            log_size = self.portfolio_log_file.stat().st_size
+        except FileNotFoundError:
+            log_size = 0
+        return (mtime, log_size)
+
+    def _load_portfolio_map(self) -> Dict[str, Dict[str, Any]]:
+        """Load portfolio items into the in-memory link-keyed map
+
+        The snapshot CSV is read first and the redo log replayed on top.
+        The map is reused as long as neither file changed on disk, so
+        repeated syncs and reads cost two stat calls instead of a parse.
+        """
+        state = self._portfolio_files_state()
+        if self._portfolio_by_link is not None and state == self._portfolio_state:
+            return self._portfolio_by_link
+
+        self._portfolio_by_link = {}
+        if state[0] is not None:
             with open(self.portfolio_file, 'r', newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
+                reader = csv.reader(f)
+                next(reader, None)  # Skip header
                 for row in reader:
-                    existing_items[row['link']] = row
-        
-        # Update or add items
-        updated_items = []
+                    item = dict(zip(PORTFOLIO_FIELDS, row))
+                    self._portfolio_by_link[item['link']] = item
+
+        # Replay logged adds/updates on top of the snapshot
+        if state[1]:
+            with open(self.portfolio_log_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        item = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Torn write at the log tail
+                    self._portfolio_by_link[item['link']] = item
+
+        self._portfolio_state = state
+        return self._portfolio_by_link
+
+    def _append_portfolio_log(self, items: List[Dict[str, Any]]) -> None:
+        """Append changed items to the redo log with a single fsync"""
+        with open(self.portfolio_log_file, 'a', encoding='utf-8') as f:
+            for item in items:
+                f.write(json.dumps(item) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        self._portfolio_state = self._portfolio_files_state()
+
+    def _portfolio_log_entries(self) -> int:
+        """Rough count of redo-log entries (newline count)"""
+        try:
+            with open(self.portfolio_log_file, 'rb') as f:
+                return f.read().count(b'\n')
+        except FileNotFoundError:
+            return 0
+
+    def sync_portfolio_items(self, items: List[Dict[str, Any]]) -> None:
+        """Sync portfolio items from CSV data to storage"""
+        existing_items = self._load_portfolio_map()
+
+        # Merge into the in-memory map; only touch disk if something changed
+        changed_items = []
         next_id = len(existing_items) + 1
-        
+
         for item_data in items:
             link = item_data['link']
             current_time = datetime.utcnow().isoformat()
-            
+
             if link in existing_items:
-                # Update existing item
-                item = existing_items[link].copy()
-                item.update({
+                item = existing_items[link]
+                updates = {
                     'name': item_data['name'],
                     'purchase_date': item_data.get('purchase_date', ''),
                     'quantity': item_data.get('quantity', 1),
                     'purchase_price': item_data.get('purchase_price', ''),
-                    'updated_at': current_time
-                })
+                }
+                # Compare as strings since CSV round-trips everything as text
+                if any(str(item.get(k, '')) != str(v) for k, v in updates.items()):
+                    item.update(updates)
+                    item['updated_at'] = current_time
+                    changed_items.append(item)
             else:
                 # Create new item
                 item = {
@@ -85,31 +218,144 @@ class CSVStorageManager:
                     'created_at': current_time,
                     'updated_at': current_time
                 }
+                existing_items[link] = item
                 next_id += 1
-            
-            updated_items.append(item)
-            existing_items[link] = item
-        
-        # Write back to CSV
+                changed_items.append(item)
+
+        if changed_items:
+            # Append just the changed rows to the redo log; fold the log
+            # into the snapshot once it has grown past the threshold
+            self._append_portfolio_log(changed_items)
+            if self._portfolio_log_entries() > self.compact_after:
+                self._write_portfolio_map()
+
+    def _write_portfolio_map(self) -> None:
+        """Compact: rewrite the snapshot CSV from the map, drop the log"""
+        items = self._portfolio_by_link.values()
         with open(self.portfolio_file, 'w', newline='', encoding='utf-8') as f:
-            if updated_items:
-                writer = csv.DictWriter(f, fieldnames=updated_items[0].keys())
-                writer.writeheader()
-                writer.writerows(existing_items.values())
-    
+            if items:
+                # Positional writer with a fixed field order avoids the
+                # per-row dict bookkeeping DictWriter does
+                writer = csv.writer(f)
+                writer.writerow(PORTFOLIO_FIELDS)
+                writer.writerows(
+                    [item.get(field, '') for field in PORTFOLIO_FIELDS]
+                    for item in items
+                )
+        # The snapshot now contains every logged change
+        try:
+            self.portfolio_log_file.unlink()
+        except FileNotFoundError:
+            pass
+        self._portfolio_state = self._portfolio_files_state()
+
     def get_portfolio_items(self) -> List[Dict[str, Any]]:
-        """Get all portfolio items"""
+        """Get all portfolio items with native numeric types
+
+        id/quantity/purchase_price are converted once here so downstream
+        consumers can drop their per-use int()/float() casts.
+        """
         items = []
-        if self.portfolio_file.exists():
-            with open(self.portfolio_file, 'r', newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                items = list(reader)
+        for item in self._load_portfolio_map().values():
+            item = dict(item)
+            item['id'] = int(item['id'])
+            item['quantity'] = int(item['quantity'] or 1)
+            item['purchase_price'] = float(item['purchase_price']) if item['purchase_price'] else None
+            items.append(item)
         return items
     
+    def _load_price_index(self) -> Dict[str, Any]:
+        """Load the price history index, rebuilding it if stale or missing"""
+        if self._price_index is not None:
+            return self._price_index
+
+        file_size = self.price_history_file.stat().st_size if self.price_history_file.exists() else 0
+
+        if self.price_index_file.exists():
+            try:
+                with open(self.price_index_file, 'r', encoding='utf-8') as f:
+                    index = json.load(f)
+                if index.get('size') == file_size:
+                    self._price_index = index
+                    return index
+            except (json.JSONDecodeError, OSError):
+                pass  # Corrupt or unreadable index, rebuild below
+
+        self._price_index = self._rebuild_price_index()
+        self._save_price_index()
+        return self._price_index
+
+    def _rebuild_price_index(self) -> Dict[str, Any]:
+        """Rebuild the index by scanning price_history.csv once"""
+        index = {'size': 0, 'offsets': {}, 'all': []}
+
+        if not self.price_history_file.exists():
+            return index
+
+        with open(self.price_history_file, 'r', newline='', encoding='utf-8',
+                  buffering=1 << 20) as f:
+            # Skip header
+            f.readline()
+            while True:
+                offset = f.tell()
+                record = f.readline()
+                if not record:
+                    break
+                # A record can span physical lines when a quoted field
+                # (e.g. a multi-line Playwright error message) embeds
+                # newlines; quotes come doubled inside fields, so the
+                # record is complete once its quote count is even
+                while record.count('"') % 2:
+                    continuation = f.readline()
+                    if not continuation:
+                        break  # Torn write at the file tail
+                    record += continuation
+                row = next(csv.reader([record]), None)
+                if not row:
+                    continue
+                index['offsets'].setdefault(row[0], []).append(offset)
+                index['all'].append(offset)
+            index['size'] = f.tell()
+
+        return index
+
+    def _save_price_index(self) -> None:
+        """Persist the price history index to its sidecar file"""
+        with open(self.price_index_file, 'w', encoding='utf-8') as f:
+            json.dump(self._price_index, f)
+
+    # Numeric price-history columns converted back to native types on read
+    _PRICE_INT_FIELDS = ('item_id', 'available_items', 'seller_count')
+    _PRICE_FLOAT_FIELDS = (
+        'from_price', 'price_trend', 'avg_30_days', 'avg_7_days',
+        'avg_1_day', 'min_seller_price', 'max_seller_price'
+    )
+
+    def _read_price_row_at(self, f, offset: int) -> Optional[Dict[str, Any]]:
+        """Read a single price history row at a known byte offset"""
+        f.seek(offset)
+        row = next(csv.reader(f), None)
+        if row is None:
+            return None
+
+        record = dict(zip(PRICE_HISTORY_FIELDS, row))
+        # Restore native numeric types lost in the CSV round trip
+        for fieldname in self._PRICE_INT_FIELDS:
+            value = record.get(fieldname)
+            record[fieldname] = int(value) if value else None
+        for fieldname in self._PRICE_FLOAT_FIELDS:
+            value = record.get(fieldname)
+            record[fieldname] = float(value) if value else None
+        return record
+
     def save_price_data(self, item_id: int, item_name: str, price_data: Dict[str, Any]) -> None:
         """Save price data for an item"""
         # Serialize seller prices to JSON
-        seller_prices_json = json.dumps(price_data.get('seller_prices', []))
+        seller_prices = price_data.get('seller_prices', [])
+        if orjson is not None:
+            seller_prices_json = orjson.dumps(seller_prices).decode('ascii')
+        else:
+            seller_prices_json = json.dumps(seller_prices)
         
         price_record = {
             'item_id': item_id,
@@ -129,67 +375,233 @@ class CSVStorageManager:
             'scraped_at': datetime.utcnow().isoformat()
         }
         
-        # Append to price history CSV
+        # Keep the raw seller list alongside the row for the Parquet mirror,
+        # which stores it as a native list column instead of a JSON string
+        if self.parquet_mirror:
+            price_record['_seller_prices'] = list(price_data.get('seller_prices', []) or [])
+
+        # Buffer the row; the batch is written out once it reaches flush_every
+        self._price_buffer.append(price_record)
+        if len(self._price_buffer) >= self.flush_every:
+            self.flush_price_data()
+
+    def save_price_data_batch(self, rows: List[Tuple[int, str, Dict[str, Any]]]) -> None:
+        """Save many (item_id, item_name, price_data) rows in one write
+
+        Buffers every row, then flushes once, so a whole tracking run costs
+        a single open/writerows/fsync instead of one per item.
+        """
+        for item_id, item_name, price_data in rows:
+            self.save_price_data(item_id, item_name, price_data)
+        self.flush_price_data()
+
+    def flush_price_data(self) -> None:
+        """Write all buffered price rows with a single flush+fsync"""
+        if not self._price_buffer:
+            return
+
+        batch, self._price_buffer = self._price_buffer, []
+        seller_lists = [record.pop('_seller_prices', []) for record in batch]
+
+        # Append the whole batch in one open/flush/fsync cycle, recording
+        # each row's byte offset for the sidecar index
+        index = self._load_price_index()
         file_exists = self.price_history_file.exists()
-        with open(self.price_history_file, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=price_record.keys())
+        with open(self.price_history_file, 'a', newline='', encoding='utf-8',
+                  buffering=1 << 18) as f:
+            writer = csv.DictWriter(f, fieldnames=PRICE_HISTORY_FIELDS)
             if not file_exists:
                 writer.writeheader()
-            writer.writerow(price_record)
-    
+            for price_record in batch:
+                offset = f.tell()
+                writer.writerow(price_record)
+                index['offsets'].setdefault(str(price_record['item_id']), []).append(offset)
+                index['all'].append(offset)
+            index['size'] = f.tell()
+            f.flush()
+            os.fsync(f.fileno())
+
+        self._save_price_index()
+
+        if self.parquet_mirror:
+            self._write_parquet_batch(batch, seller_lists)
+
+    def _write_parquet_batch(self, batch: List[Dict[str, Any]],
+                             seller_lists: List[List[float]]) -> None:
+        """Append a batch of price rows to the Parquet mirror"""
+        def _float_or_none(value):
+            return float(value) if value not in ('', None) else None
+
+        table = pa.table({
+            'item_id': pa.array([int(r['item_id']) for r in batch], pa.int32()),
+            'item_name': pa.array([r['item_name'] for r in batch], pa.string()),
+            'available_items': pa.array([_float_or_none(r['available_items']) for r in batch], pa.float32()),
+            'from_price': pa.array([_float_or_none(r['from_price']) for r in batch], pa.float32()),
+            'price_trend': pa.array([_float_or_none(r['price_trend']) for r in batch], pa.float32()),
+            'avg_30_days': pa.array([_float_or_none(r['avg_30_days']) for r in batch], pa.float32()),
+            'avg_7_days': pa.array([_float_or_none(r['avg_7_days']) for r in batch], pa.float32()),
+            'avg_1_day': pa.array([_float_or_none(r['avg_1_day']) for r in batch], pa.float32()),
+            'min_seller_price': pa.array([_float_or_none(r['min_seller_price']) for r in batch], pa.float32()),
+            'max_seller_price': pa.array([_float_or_none(r['max_seller_price']) for r in batch], pa.float32()),
+            'seller_count': pa.array([int(r['seller_count'] or 0) for r in batch], pa.int32()),
+            'seller_prices': pa.array(seller_lists, pa.list_(pa.float32())),
+            'scrape_status': pa.array([r['scrape_status'] for r in batch], pa.string()),
+            'error_message': pa.array([r['error_message'] for r in batch], pa.string()),
+            'scraped_at': pa.array([r['scraped_at'] for r in batch], pa.string()),
+        })
+
+        if self._parquet_writer is None:
+            self._parquet_writer = pq.ParquetWriter(self.parquet_file, table.schema)
+        self._parquet_writer.write_table(table)
+
+    def close(self) -> None:
+        """Flush pending rows and release the Parquet writer, if any
+
+        Safe to call repeatedly; also registered via atexit so buffered
+        rows and an open Parquet writer are not lost on process exit.
+        """
+        try:
+            self.flush_price_data()
+        except OSError:
+            # The data directory may already be gone when the atexit hook
+            # fires (e.g. a TemporaryDirectory fixture); nothing to flush to
+            pass
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+
     def get_latest_price_data(self, item_id: int) -> Optional[Dict[str, Any]]:
         """Get latest price data for an item"""
-        latest_record = None
-        if self.price_history_file.exists():
-            with open(self.price_history_file, 'r', newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    if row['item_id'] == str(item_id):
-                        latest_record = row
-        return latest_record
-    
+        self.flush_price_data()
+        offsets = self._load_price_index()['offsets'].get(str(item_id))
+        if not offsets:
+            return None
+
+        with open(self.price_history_file, 'r', newline='', encoding='utf-8') as f:
+            return self._read_price_row_at(f, offsets[-1])
+
+    def get_latest_prices_by_id(self) -> Dict[int, Dict[str, Any]]:
+        """Get the latest price record for every item in one index pass
+
+        One file handle and one seek per item, versus callers issuing a
+        get_latest_price_data lookup (and its index load) per item.
+        """
+        self.flush_price_data()
+        index = self._load_price_index()
+        if not index['offsets']:
+            return {}
+
+        latest = {}
+        with open(self.price_history_file, 'r', newline='', encoding='utf-8') as f:
+            for item_id, offsets in index['offsets'].items():
+                if offsets:
+                    latest[int(item_id)] = self._read_price_row_at(f, offsets[-1])
+        return latest
+
     def get_price_history(self, item_id: int, limit: int = 100) -> List[Dict[str, Any]]:
-        """Get price history for an item"""
+        """Get price history for an item, newest first
+
+        Only the `limit` newest rows are ever read and materialized, so
+        peak memory is O(limit) regardless of how large the history grows.
+        """
+        self.flush_price_data()
+        offsets = self._load_price_index()['offsets'].get(str(item_id))
+        if not offsets:
+            return []
+
+        # Offsets are appended chronologically, so the newest rows are last
         records = []
-        if self.price_history_file.exists():
-            with open(self.price_history_file, 'r', newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    if row['item_id'] == str(item_id):
-                        records.append(row)
-        
-        # Sort by scraped_at descending and limit
-        records.sort(key=lambda x: x['scraped_at'], reverse=True)
-        return records[:limit]
+        with open(self.price_history_file, 'r', newline='', encoding='utf-8') as f:
+            for offset in reversed(offsets[-limit:]):
+                row = self._read_price_row_at(f, offset)
+                if row is not None:
+                    records.append(row)
+        return records
     
     def get_all_price_records(self) -> List[Dict[str, Any]]:
         """Get all price records for verification"""
+        self.flush_price_data()
         records = []
         if self.price_history_file.exists():
-            with open(self.price_history_file, 'r', newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                records = list(reader)
-        
+            with open(self.price_history_file, 'r', newline='', encoding='utf-8',
+                      buffering=1 << 20) as f:
+                reader = csv.reader(f)
+                next(reader, None)  # Skip header
+                records = [dict(zip(PRICE_HISTORY_FIELDS, row)) for row in reader]
+
         # Sort by scraped_at descending
         records.sort(key=lambda x: x['scraped_at'], reverse=True)
         return records
     
+    def get_price_columns(self) -> Dict[str, Any]:
+        """Columnar NumPy view of the price history for analytics
+
+        Returns one typed array per numeric column (missing values as NaN)
+        plus scraped_at as datetime64, so aggregations over the history run
+        as vectorized column scans instead of per-row string parsing. The
+        result is cached and rebuilt only when the CSV has grown.
+        """
+        if np is None:
+            raise RuntimeError("NumPy is required for get_price_columns")
+
+        self.flush_price_data()
+        size = self._load_price_index()['size']
+        if self._price_columns is not None and size == self._price_columns_size:
+            return self._price_columns
+
+        raw = {field: [] for field in PRICE_HISTORY_FIELDS}
+        if self.price_history_file.exists():
+            with open(self.price_history_file, 'r', newline='', encoding='utf-8',
+                      buffering=1 << 20) as f:
+                reader = csv.reader(f)
+                next(reader, None)  # Skip header
+                for row in reader:
+                    for field, value in zip(PRICE_HISTORY_FIELDS, row):
+                        raw[field].append(value)
+
+        def _float_column(values):
+            return np.array([float(v) if v else np.nan for v in values], dtype=np.float32)
+
+        self._price_columns = {
+            'item_id': np.array([int(v) for v in raw['item_id']], dtype=np.int32),
+            'available_items': _float_column(raw['available_items']),
+            'from_price': _float_column(raw['from_price']),
+            'price_trend': _float_column(raw['price_trend']),
+            'avg_30_days': _float_column(raw['avg_30_days']),
+            'avg_7_days': _float_column(raw['avg_7_days']),
+            'avg_1_day': _float_column(raw['avg_1_day']),
+            'min_seller_price': _float_column(raw['min_seller_price']),
+            'max_seller_price': _float_column(raw['max_seller_price']),
+            'seller_count': np.array([int(v or 0) for v in raw['seller_count']], dtype=np.int32),
+            'scraped_at': np.array(raw['scraped_at'], dtype='datetime64[us]'),
+        }
+        self._price_columns_size = size
+        return self._price_columns
+
     def get_recent_price_records(self, hours: int = 2) -> List[Dict[str, Any]]:
         """Get price records from the last N hours"""
+        self.flush_price_data()
         from datetime import timedelta
         
-        cutoff_time = datetime.utcnow() - timedelta(hours=hours)
+        # ISO-8601 timestamps sort lexicographically, so compare the raw
+        # strings instead of parsing every row's scraped_at
+        cutoff_iso = (datetime.utcnow() - timedelta(hours=hours)).isoformat()
         recent_records = []
-        
-        if self.price_history_file.exists():
-            with open(self.price_history_file, 'r', newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    try:
-                        scraped_time = datetime.fromisoformat(row['scraped_at'])
-                        if scraped_time >= cutoff_time:
-                            recent_records.append(row)
-                    except (ValueError, KeyError):
-                        continue
-        
+
+        # Rows are appended in time order, so walk backwards from the newest
+        # row and stop at the first one older than the cutoff
+        all_offsets = self._load_price_index()['all']
+        if not all_offsets:
+            return recent_records
+
+        with open(self.price_history_file, 'r', newline='', encoding='utf-8') as f:
+            for offset in reversed(all_offsets):
+                row = self._read_price_row_at(f, offset)
+                if row is None:
+                    continue
+                if row.get('scraped_at', '') < cutoff_iso:
+                    break
+                recent_records.append(row)
+
+        recent_records.reverse()
         return recent_records
\ No newline at end of file
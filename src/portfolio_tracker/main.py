@@ -0,0 +1,32 @@
+"""Main entry point for Portfolio Tracker"""
+
+import asyncio
+import sys
+
+from .tracker import PortfolioTracker
+
+# uvloop is a drop-in, faster event loop; optional and not available on Windows
+if sys.platform != "win32":
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+else:
+    uvloop = None
+
+
+async def main():
+    """Main function for running the tracker"""
+    tracker = PortfolioTracker()
+    await tracker.track_all_items()
+
+
+def run():
+    """Synchronous console-script entry point wrapping the async main"""
+    if uvloop is not None:
+        uvloop.install()
+    asyncio.run(main())
+
+
+if __name__ == "__main__":
+    run()
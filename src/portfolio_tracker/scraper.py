@@ -1,6 +1,7 @@
 """Web scraper for CardMarket price data"""
 
 import re
+import time
 import asyncio
 import random
 import logging
@@ -12,8 +13,268 @@ from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from playwright.async_api import async_playwright
 
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:  # Optional fast HTML parser; regex fallback still works
+    HTMLParser = None
+
+try:
+    import numpy as np
+except ImportError:  # Optional; pure-Python filtering is used instead
+    np = None
+
+try:
+    import httpx
+except ImportError:  # Optional HTTP/2 client; aiohttp is used instead
+    httpx = None
+
+try:
+    from playwright_stealth import Stealth
+except ImportError:  # Optional; the inline stealth script is used instead
+    Stealth = None
+
 logger = logging.getLogger(__name__)
 
+# Precompiled extraction patterns, compiled once at import and shared by
+# every scraper instance
+_MARKET_PATTERNS = {
+    'available_items': re.compile(r'Available items</dt><dd[^>]*>(\d+)</dd>'),
+    'from_price': re.compile(r'From</dt><dd[^>]*>([\d,]+\.?\d*)\s*€</dd>'),
+    'price_trend': re.compile(r'Price Trend</dt><dd[^>]*><span>([\d,]+\.?\d*)\s*€</span></dd>'),
+    'avg_30_days': re.compile(r'30-days average price</dt><dd[^>]*><span>([\d,]+\.?\d*)\s*€</span></dd>'),
+    'avg_7_days': re.compile(r'7-days average price</dt><dd[^>]*><span>([\d,]+\.?\d*)\s*€</span></dd>'),
+    'avg_1_day': re.compile(r'1-day average price</dt><dd[^>]*><span>([\d,]+\.?\d*)\s*€</span></dd>')
+}
+_SELLER_PRICE_RE = re.compile(r'(\d+,?\d*\.?\d*)\s*€')
+
+# Cloudflare challenge widgets, shared between the in-page wait predicate
+# and the _is_challenge_page probe so the list lives in one place
+_CHALLENGE_SELECTORS = '#challenge-form, #challenge-running, .cf-browser-verification'
+
+# Fused alternation of all market-data patterns so the HTML is walked once
+# instead of once per field; each branch captures its value in a '<name>_v'
+# group and finditer dispatches on lastgroup
+_MARKET_RE = re.compile('|'.join(
+    f'(?P<{name}>{pattern.pattern.replace("(", f"(?P<{name}_v>", 1)})'
+    for name, pattern in _MARKET_PATTERNS.items()
+))
+
+# Launch flags tuned for CI containers and Cloudflare bypass; built once
+# at import instead of per browser launch
+_BROWSER_ARGS = (
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-accelerated-2d-canvas',
+    '--no-first-run',
+    '--disable-gpu',
+    '--disable-web-security',
+    '--disable-features=VizDisplayCompositor',
+    '--disable-extensions',
+    '--disable-plugins',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--disable-translate',
+    '--hide-scrollbars',
+    '--mute-audio',
+    '--no-default-browser-check',
+    '--no-pings',
+    '--disable-background-networking',
+    '--disable-background-timer-throttling',
+    '--disable-client-side-phishing-detection',
+    '--disable-component-extensions-with-background-pages',
+    '--disable-hang-monitor',
+    '--disable-prompt-on-repost',
+    '--disable-web-resources',
+    '--enable-automation=false',
+    '--disable-blink-features=AutomationControlled',
+    '--disable-extensions-except',
+    '--disable-plugins-discovery',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding',
+    '--disable-ipc-flooding-protection',
+    '--disable-domain-reliability',
+    '--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36'
+    )
+
+# Stealth script injected into every new context to mask automation
+_STEALTH_INIT_SCRIPT = """
+             // Remove webdriver property
+             Object.defineProperty(navigator, 'webdriver', {
+                 get: () => undefined,
+             });
+            
+             // Remove automation indicators
+             delete window.cdc_adoQpoasnfa76pfcZLmcfl_Array;
+             delete window.cdc_adoQpoasnfa76pfcZLmcfl_Promise;
+             delete window.cdc_adoQpoasnfa76pfcZLmcfl_Symbol;
+            
+             // Remove additional automation indicators
+             delete window.cdc_adoQpoasnfa76pfcZLmcfl_Object;
+             delete window.cdc_adoQpoasnfa76pfcZLmcfl_JSON;
+             delete window.cdc_adoQpoasnfa76pfcZLmcfl_Function;
+             delete window.cdc_adoQpoasnfa76pfcZLmcfl_String;
+            
+             // Mock chrome property with realistic values
+             window.chrome = {
+                 runtime: {
+                     onConnect: null,
+                     onMessage: null
+                 },
+                 loadTimes: function() {
+                     return {
+                         requestTime: Date.now() / 1000 - Math.random(),
+                         startLoadTime: Date.now() / 1000 - Math.random(),
+                         commitLoadTime: Date.now() / 1000 - Math.random(),
+                         finishDocumentLoadTime: Date.now() / 1000 - Math.random(),
+                         finishLoadTime: Date.now() / 1000 - Math.random(),
+                         firstPaintTime: Date.now() / 1000 - Math.random(),
+                         firstPaintAfterLoadTime: 0,
+                         navigationType: 'Other',
+                         wasFetchedViaSpdy: false,
+                         wasNpnNegotiated: false,
+                         npnNegotiatedProtocol: 'unknown',
+                         wasAlternateProtocolAvailable: false,
+                         connectionInfo: 'http/1.1'
+                     };
+                 },
+                 csi: function() {
+                     return {
+                         pageT: Date.now(),
+                         tran: 15
+                     };
+                 },
+                 app: {
+                     isInstalled: false,
+                     InstallState: {
+                         DISABLED: 'disabled',
+                         INSTALLED: 'installed',
+                         NOT_INSTALLED: 'not_installed'
+                     },
+                     RunningState: {
+                         CANNOT_RUN: 'cannot_run',
+                         READY_TO_RUN: 'ready_to_run',
+                         RUNNING: 'running'
+                     }
+                 }
+             };
+            
+             // Mock realistic plugins
+             Object.defineProperty(navigator, 'plugins', {
+                 get: () => ({
+                     length: 3,
+                     0: { 
+                         name: 'Chrome PDF Plugin',
+                         filename: 'internal-pdf-viewer',
+                         description: 'Portable Document Format'
+                     },
+                     1: { 
+                         name: 'Chrome PDF Viewer',
+                         filename: 'mhjfbmdgcfjbbpaeojofohoefgiehjai',
+                         description: ''
+                     },
+                     2: { 
+                         name: 'Native Client',
+                         filename: 'internal-nacl-plugin',
+                         description: ''
+                     }
+                 }),
+             });
+            
+             // Mock languages
+             Object.defineProperty(navigator, 'languages', {
+                 get: () => ['en-US', 'en'],
+             });
+            
+             // Mock hardware concurrency
+             Object.defineProperty(navigator, 'hardwareConcurrency', {
+                 get: () => 4,
+             });
+            
+             // Mock device memory
+             Object.defineProperty(navigator, 'deviceMemory', {
+                 get: () => 8,
+             });
+            
+             // Mock connection
+             Object.defineProperty(navigator, 'connection', {
+                 get: () => ({
+                     effectiveType: '4g',
+                     rtt: 50,
+                     downlink: 10
+                 }),
+             });
+            
+             // Override permissions
+             const originalQuery = window.navigator.permissions.query;
+             window.navigator.permissions.query = (parameters) => (
+                 parameters.name === 'notifications' ?
+                     Promise.resolve({ state: Notification.permission }) :
+                     originalQuery(parameters)
+             );
+            
+             // Mock screen properties
+             Object.defineProperty(screen, 'colorDepth', {
+                 get: () => 24,
+             });
+            
+             Object.defineProperty(screen, 'pixelDepth', {
+                 get: () => 24,
+             });
+            
+             // Mock realistic screen resolution
+             Object.defineProperty(screen, 'availWidth', {
+                 get: () => 1920,
+             });
+            
+             Object.defineProperty(screen, 'availHeight', {
+                 get: () => 1040,
+             });
+            
+             // Hide automation from iframe detection
+             Object.defineProperty(HTMLIFrameElement.prototype, 'contentWindow', {
+                 get: function() {
+                     return window;
+                 }
+             });
+            
+             // Mock Date.prototype.getTimezoneOffset
+             const originalGetTimezoneOffset = Date.prototype.getTimezoneOffset;
+             Date.prototype.getTimezoneOffset = function() {
+                 return 300; // EST timezone
+             };
+            
+             // Override toString methods to hide proxy
+             Function.prototype.toString = new Proxy(Function.prototype.toString, {
+                 apply: function(target, thisArg, argumentsList) {
+                     if (thisArg === navigator.webdriver) {
+                         return 'function webdriver() { [native code] }';
+                     }
+                     return target.apply(thisArg, argumentsList);
+                 }
+             });
+            
+             // Mock battery API
+             Object.defineProperty(navigator, 'getBattery', {
+                 get: () => () => Promise.resolve({
+                     charging: true,
+                     chargingTime: 0,
+                     dischargingTime: Infinity,
+                     level: 1
+                 }),
+             });
+            
+             // Mock media devices
+             Object.defineProperty(navigator, 'mediaDevices', {
+                 get: () => ({
+                     enumerateDevices: () => Promise.resolve([
+                         { deviceId: 'default', kind: 'audioinput', label: 'Default - Microphone' },
+                         { deviceId: 'default', kind: 'audiooutput', label: 'Default - Speaker' }
+                     ])
+                 }),
+             });
+         """
+
 
 class CardMarketScraper:
     """Scraper for CardMarket website"""
@@ -41,6 +302,35 @@ class CardMarketScraper:
         ]
         self.is_github_actions = os.getenv('GITHUB_ACTIONS') == 'true'
         logger.info(f"[INIT] Running in GitHub Actions: {self.is_github_actions}")
+
+        # Shared Playwright browser/context, launched lazily on first scrape
+        # and reused across items instead of relaunching chromium per URL
+        self._pw = None
+        self._browser = None
+        self._context = None
+        self._session_user_agent = None
+        self._warmed_games = set()
+
+        # Serialize lazy browser startup and per-game warm-up: with the
+        # HTTP-first path, concurrent scrapes can escalate to the browser
+        # together and would otherwise race these check-then-act inits
+        self._browser_lock = asyncio.Lock()
+        self._warmup_lock = asyncio.Lock()
+
+        # Shared aiohttp session for HTTP fallbacks, created lazily so
+        # connections and DNS lookups are reused across items
+        self._http_session = None
+
+        # Short-lived per-URL result cache so repeated lookups within one
+        # run (duplicate portfolio rows, summary refreshes) skip the network
+        self._result_cache = {}
+        self._result_cache_ttl = 600.0
+
+        # Extraction patterns are compiled once at module load and shared
+        # across instances; keep instance aliases for existing callers
+        self._patterns = _MARKET_PATTERNS
+        self._seller_price_pattern = _SELLER_PRICE_RE
+        self._market_pattern = _MARKET_RE
     
     def _get_random_user_agent(self) -> str:
         """Get a random user agent"""
@@ -68,435 +358,386 @@ class CardMarketScraper:
         }
         return headers
     
-    async def scrape_item_price(self, item_url: str) -> Dict[str, Any]:
-        """Scrape price data for a single item"""
-        logger.info(f"[SCRAPE] Scraping: {item_url}")
-        logger.info(f"[DEBUG] GitHub Actions: {self.is_github_actions}")
-        
-        # Get random user agent and headers for this request
-        user_agent = self._get_random_user_agent()
-        headers = self._get_random_headers()
-        logger.info(f"[DEBUG] Using User-Agent: {user_agent[:50]}...")
-        
-        async with async_playwright() as p:
-            try:
-                # Enhanced browser arguments for GitHub Actions with Cloudflare bypass
-                browser_args = [
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-accelerated-2d-canvas',
-                    '--no-first-run',
-                    '--no-zygote',
-                    '--single-process',
-                    '--disable-gpu',
-                    '--disable-web-security',
-                    '--disable-features=VizDisplayCompositor',
-                    '--disable-extensions',
-                    '--disable-plugins',
-                    '--disable-default-apps',
-                    '--disable-sync',
-                    '--disable-translate',
-                    '--hide-scrollbars',
-                    '--mute-audio',
-                    '--no-default-browser-check',
-                    '--no-pings',
-                    '--disable-background-networking',
-                    '--disable-background-timer-throttling',
-                    '--disable-client-side-phishing-detection',
-                    '--disable-component-extensions-with-background-pages',
-                    '--disable-hang-monitor',
-                    '--disable-prompt-on-repost',
-                    '--disable-web-resources',
-                    '--enable-automation=false',
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-extensions-except',
-                    '--disable-plugins-discovery',
-                    '--disable-backgrounding-occluded-windows',
-                    '--disable-renderer-backgrounding',
-                    '--disable-ipc-flooding-protection',
-                    '--disable-domain-reliability',
-                    '--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36'
-                ]
-                
+    async def _ensure_browser(self):
+        """Launch the shared browser and context on first use
+
+        Lock-guarded: when the HTTP path gets blocked, several concurrent
+        scrapes escalate here at once, and without the lock each would
+        start its own driver and Chromium, leaking all but the last.
+        """
+        if self._context is not None:
+            return self._context
+
+        async with self._browser_lock:
+            # Re-check under the lock: another escalating task may have
+            # finished the launch while this one was waiting
+            if self._context is not None:
+                return self._context
+
+            self._pw = await async_playwright().start()
+
+            # One user agent / header set per browser session
+            user_agent = self._get_random_user_agent()
+            headers = self._get_random_headers()
+            self._session_user_agent = user_agent
+            logger.debug(f"[DEBUG] Using User-Agent: {user_agent[:50]}...")
+
+            # Attach to an already-running browser over CDP when one is
+            # provided (e.g. a warm remote Chromium), skipping launch cost
+            cdp_url = os.getenv('CDP_URL')
+            if cdp_url:
+                logger.info(f"[INIT] Connecting to existing browser over CDP: {cdp_url}")
+                self._browser = await self._pw.chromium.connect_over_cdp(cdp_url)
+            else:
+                browser_args = list(_BROWSER_ARGS)
+
                 # Additional args for GitHub Actions (remove duplicates)
                 if self.is_github_actions:
                     browser_args.extend([
                         '--disable-features=TranslateUI',
                         '--force-device-scale-factor=1'
                     ])
-                    logger.info("[DEBUG] Added GitHub Actions specific browser args")
-                
-                browser = await p.chromium.launch(
+                    logger.debug("[DEBUG] Added GitHub Actions specific browser args")
+
+                self._browser = await self._pw.chromium.launch(
                     headless=True,
                     args=browser_args
                 )
-                
-                # Create context with randomized settings and stealth mode
-                context = await browser.new_context(
-                    viewport={
-                        'width': random.randint(1200, 1920), 
-                        'height': random.randint(800, 1080)
-                    },
-                    user_agent=user_agent,
-                    extra_http_headers={
-                        **headers,
-                        # Override sec-ch-ua headers to mask headless detection with realistic values
-                        'sec-ch-ua': '"Google Chrome";v="130", "Chromium";v="130", "Not?A_Brand";v="99"',
-                        'sec-ch-ua-arch': '"x64"',
-                        'sec-ch-ua-bitness': '"64"',
-                        'sec-ch-ua-full-version': '"130.0.6723.70"',
-                        'sec-ch-ua-full-version-list': '"Google Chrome";v="130.0.6723.70", "Chromium";v="130.0.6723.70", "Not?A_Brand";v="99.0.0.0"',
-                        'sec-ch-ua-mobile': '?0',
-                        'sec-ch-ua-model': '""',
-                        'sec-ch-ua-platform': '"Windows"',
-                        'sec-ch-ua-platform-version': '"15.0.0"',
-                        'sec-ch-ua-wow64': '?0',
-                        # Additional realistic headers
-                        'sec-ch-prefers-color-scheme': 'light',
-                        'sec-ch-prefers-reduced-motion': 'no-preference',
-                        'sec-ch-viewport-width': '1920',
-                        'sec-ch-device-memory': '8',
-                        'sec-ch-dpr': '1',
-                        'viewport-width': '1920',
-                        'dpr': '1',
-                        # Browser hints
-                        'save-data': 'off',
-                        'downlink': '10',
-                        'ect': '4g',
-                        'rtt': '50'
-                    },
-                    java_script_enabled=True,
-                    accept_downloads=False,
-                    ignore_https_errors=True,
-                    locale='en-US',
-                    timezone_id='America/New_York',
-                    geolocation={'latitude': 40.7128, 'longitude': -74.0060},
-                    permissions=['geolocation']
+            
+            # Create context with randomized settings and stealth mode
+            self._context = await self._browser.new_context(
+                viewport={
+                    'width': random.randint(1200, 1920), 
+                    'height': random.randint(800, 1080)
+                },
+                user_agent=user_agent,
+                extra_http_headers={
+                    **headers,
+                    # Override sec-ch-ua headers to mask headless detection with realistic values
+                    'sec-ch-ua': '"Google Chrome";v="130", "Chromium";v="130", "Not?A_Brand";v="99"',
+                    'sec-ch-ua-arch': '"x64"',
+                    'sec-ch-ua-bitness': '"64"',
+                    'sec-ch-ua-full-version': '"130.0.6723.70"',
+                    'sec-ch-ua-full-version-list': '"Google Chrome";v="130.0.6723.70", "Chromium";v="130.0.6723.70", "Not?A_Brand";v="99.0.0.0"',
+                    'sec-ch-ua-mobile': '?0',
+                    'sec-ch-ua-model': '""',
+                    'sec-ch-ua-platform': '"Windows"',
+                    'sec-ch-ua-platform-version': '"15.0.0"',
+                    'sec-ch-ua-wow64': '?0',
+                    # Additional realistic headers
+                    'sec-ch-prefers-color-scheme': 'light',
+                    'sec-ch-prefers-reduced-motion': 'no-preference',
+                    'sec-ch-viewport-width': '1920',
+                    'sec-ch-device-memory': '8',
+                    'sec-ch-dpr': '1',
+                    'viewport-width': '1920',
+                    'dpr': '1',
+                    # Browser hints
+                    'save-data': 'off',
+                    'downlink': '10',
+                    'ect': '4g',
+                    'rtt': '50'
+                },
+                java_script_enabled=True,
+                accept_downloads=False,
+                ignore_https_errors=True,
+                locale='en-US',
+                timezone_id='America/New_York',
+                geolocation={'latitude': 40.7128, 'longitude': -74.0060},
+                permissions=['geolocation']
+            )
+            
+            # Prefer the maintained playwright-stealth evasions; fall back to
+            # the inline script (a module constant) when it is not installed
+            if Stealth is not None:
+                await Stealth().apply_stealth_async(self._context)
+            else:
+                await self._context.add_init_script(_STEALTH_INIT_SCRIPT)
+
+            # Abort heavyweight resources (images, media, fonts) that never feed
+            # the extraction, so pages finish loading with far fewer bytes
+            await self._context.route('**/*', self._filter_route)
+
+            return self._context
+
+    async def _is_challenge_page(self, page) -> bool:
+        """Detect a Cloudflare challenge without serializing the document
+
+        A selector probe for the challenge widgets plus the page title is a
+        couple of cheap CDP round-trips, versus pulling hundreds of KB of
+        HTML through page.content() just to substring-scan it.
+        """
+        try:
+            challenge = await page.query_selector(_CHALLENGE_SELECTORS)
+            if challenge is not None:
+                return True
+            title = (await page.title()).lower()
+            return 'just a moment' in title or 'attention required' in title
+        except Exception:
+            return False
+
+    async def _filter_route(self, route):
+        """Route handler that drops resource types we never parse"""
+        if route.request.resource_type in {'image', 'media', 'font'}:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def _ensure_http(self):
+        """Return the shared fallback HTTP client, creating it on first use
+
+        Prefers an httpx client negotiating HTTP/2, which multiplexes
+        concurrent requests over one TLS connection; falls back to a tuned
+        aiohttp session when httpx is not installed.
+        """
+        if self._http_session is None:
+            if httpx is not None:
+                self._http_session = httpx.AsyncClient(
+                    http2=True,
+                    timeout=30.0,
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=8),
+                    follow_redirects=True
                 )
-                
-                # Add comprehensive stealth mode scripts to mask automation
-                await context.add_init_script("""
-                     // Remove webdriver property
-                     Object.defineProperty(navigator, 'webdriver', {
-                         get: () => undefined,
-                     });
-                     
-                     // Remove automation indicators
-                     delete window.cdc_adoQpoasnfa76pfcZLmcfl_Array;
-                     delete window.cdc_adoQpoasnfa76pfcZLmcfl_Promise;
-                     delete window.cdc_adoQpoasnfa76pfcZLmcfl_Symbol;
-                     
-                     // Remove additional automation indicators
-                     delete window.cdc_adoQpoasnfa76pfcZLmcfl_Object;
-                     delete window.cdc_adoQpoasnfa76pfcZLmcfl_JSON;
-                     delete window.cdc_adoQpoasnfa76pfcZLmcfl_Function;
-                     delete window.cdc_adoQpoasnfa76pfcZLmcfl_String;
-                     
-                     // Mock chrome property with realistic values
-                     window.chrome = {
-                         runtime: {
-                             onConnect: null,
-                             onMessage: null
-                         },
-                         loadTimes: function() {
-                             return {
-                                 requestTime: Date.now() / 1000 - Math.random(),
-                                 startLoadTime: Date.now() / 1000 - Math.random(),
-                                 commitLoadTime: Date.now() / 1000 - Math.random(),
-                                 finishDocumentLoadTime: Date.now() / 1000 - Math.random(),
-                                 finishLoadTime: Date.now() / 1000 - Math.random(),
-                                 firstPaintTime: Date.now() / 1000 - Math.random(),
-                                 firstPaintAfterLoadTime: 0,
-                                 navigationType: 'Other',
-                                 wasFetchedViaSpdy: false,
-                                 wasNpnNegotiated: false,
-                                 npnNegotiatedProtocol: 'unknown',
-                                 wasAlternateProtocolAvailable: false,
-                                 connectionInfo: 'http/1.1'
-                             };
-                         },
-                         csi: function() {
-                             return {
-                                 pageT: Date.now(),
-                                 tran: 15
-                             };
-                         },
-                         app: {
-                             isInstalled: false,
-                             InstallState: {
-                                 DISABLED: 'disabled',
-                                 INSTALLED: 'installed',
-                                 NOT_INSTALLED: 'not_installed'
-                             },
-                             RunningState: {
-                                 CANNOT_RUN: 'cannot_run',
-                                 READY_TO_RUN: 'ready_to_run',
-                                 RUNNING: 'running'
-                             }
-                         }
-                     };
-                     
-                     // Mock realistic plugins
-                     Object.defineProperty(navigator, 'plugins', {
-                         get: () => ({
-                             length: 3,
-                             0: { 
-                                 name: 'Chrome PDF Plugin',
-                                 filename: 'internal-pdf-viewer',
-                                 description: 'Portable Document Format'
-                             },
-                             1: { 
-                                 name: 'Chrome PDF Viewer',
-                                 filename: 'mhjfbmdgcfjbbpaeojofohoefgiehjai',
-                                 description: ''
-                             },
-                             2: { 
-                                 name: 'Native Client',
-                                 filename: 'internal-nacl-plugin',
-                                 description: ''
-                             }
-                         }),
-                     });
-                     
-                     // Mock languages
-                     Object.defineProperty(navigator, 'languages', {
-                         get: () => ['en-US', 'en'],
-                     });
-                     
-                     // Mock hardware concurrency
-                     Object.defineProperty(navigator, 'hardwareConcurrency', {
-                         get: () => 4,
-                     });
-                     
-                     // Mock device memory
-                     Object.defineProperty(navigator, 'deviceMemory', {
-                         get: () => 8,
-                     });
-                     
-                     // Mock connection
-                     Object.defineProperty(navigator, 'connection', {
-                         get: () => ({
-                             effectiveType: '4g',
-                             rtt: 50,
-                             downlink: 10
-                         }),
-                     });
-                     
-                     // Override permissions
-                     const originalQuery = window.navigator.permissions.query;
-                     window.navigator.permissions.query = (parameters) => (
-                         parameters.name === 'notifications' ?
-                             Promise.resolve({ state: Notification.permission }) :
-                             originalQuery(parameters)
-                     );
-                     
-                     // Mock screen properties
-                     Object.defineProperty(screen, 'colorDepth', {
-                         get: () => 24,
-                     });
-                     
-                     Object.defineProperty(screen, 'pixelDepth', {
-                         get: () => 24,
-                     });
-                     
-                     // Mock realistic screen resolution
-                     Object.defineProperty(screen, 'availWidth', {
-                         get: () => 1920,
-                     });
-                     
-                     Object.defineProperty(screen, 'availHeight', {
-                         get: () => 1040,
-                     });
-                     
-                     // Hide automation from iframe detection
-                     Object.defineProperty(HTMLIFrameElement.prototype, 'contentWindow', {
-                         get: function() {
-                             return window;
-                         }
-                     });
-                     
-                     // Mock Date.prototype.getTimezoneOffset
-                     const originalGetTimezoneOffset = Date.prototype.getTimezoneOffset;
-                     Date.prototype.getTimezoneOffset = function() {
-                         return 300; // EST timezone
-                     };
-                     
-                     // Override toString methods to hide proxy
-                     Function.prototype.toString = new Proxy(Function.prototype.toString, {
-                         apply: function(target, thisArg, argumentsList) {
-                             if (thisArg === navigator.webdriver) {
-                                 return 'function webdriver() { [native code] }';
-                             }
-                             return target.apply(thisArg, argumentsList);
-                         }
-                     });
-                     
-                     // Mock battery API
-                     Object.defineProperty(navigator, 'getBattery', {
-                         get: () => () => Promise.resolve({
-                             charging: true,
-                             chargingTime: 0,
-                             dischargingTime: Infinity,
-                             level: 1
-                         }),
-                     });
-                     
-                     // Mock media devices
-                     Object.defineProperty(navigator, 'mediaDevices', {
-                         get: () => ({
-                             enumerateDevices: () => Promise.resolve([
-                                 { deviceId: 'default', kind: 'audioinput', label: 'Default - Microphone' },
-                                 { deviceId: 'default', kind: 'audiooutput', label: 'Default - Speaker' }
-                             ])
-                         }),
-                     });
-                 """)
-                
-                page = await context.new_page()
-                
-                # Add request interception for debugging
-                async def handle_response(response):
-                    if response.url == item_url:
-                        logger.info(f"[DEBUG] Response status: {response.status}")
-                        logger.info(f"[DEBUG] Response headers: {dict(response.headers)}")
-                        if response.status == 403:
-                            logger.error(f"[DEBUG] 403 Forbidden for {response.url}")
-                            logger.error(f"[DEBUG] Request headers: {dict(response.request.headers)}")
-                
-                page.on('response', handle_response)
-                
-                # Determine game type from URL
-                game_type = "Magic" if "/Magic/" in item_url else "Pokemon"
-                logger.info(f"[DEBUG] Detected game type: {game_type}")
-                
-                # Step 1: Visit homepage with enhanced delays for GitHub Actions
-                logger.info(f"[DEBUG] Step 1: Visiting homepage")
-                homepage_response = await page.goto(f'{self.base_url}/', wait_until='domcontentloaded')
-                logger.info(f"[DEBUG] Homepage response: {homepage_response.status}")
-                await page.wait_for_load_state('networkidle')
-                
-                # Longer delays for GitHub Actions
-                delay = random.uniform(2, 4) if self.is_github_actions else random.uniform(1, 2)
-                await asyncio.sleep(delay)
-                
-                # Step 2: Navigate to game section
-                game_url = f'{self.base_url}/en/{game_type}'
-                logger.info(f"[DEBUG] Step 2: Visiting game section: {game_url}")
-                game_response = await page.goto(game_url, wait_until='domcontentloaded')
-                logger.info(f"[DEBUG] Game section response: {game_response.status}")
-                await page.wait_for_load_state('networkidle')
-                
-                delay = random.uniform(2, 4) if self.is_github_actions else random.uniform(1, 2)
-                await asyncio.sleep(delay)
-                
-                # Step 3: Navigate to product page with Cloudflare handling
-                logger.info(f"[DEBUG] Step 3: Visiting product page: {item_url}")
+            else:
+                connector = aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=8,
+                    keepalive_timeout=30,
+                    ttl_dns_cache=300
+                )
+                self._http_session = aiohttp.ClientSession(
+                    connector=connector,
+                    timeout=aiohttp.ClientTimeout(total=30)
+                )
+        return self._http_session
+
+    async def _http_get(self, item_url: str, headers: Dict[str, str]) -> Tuple[int, str]:
+        """GET a URL over the shared client, returning (status, body text)"""
+        session = self._ensure_http()
+        if httpx is not None and isinstance(session, httpx.AsyncClient):
+            response = await session.get(item_url, headers=headers)
+            return response.status_code, response.text
+        async with session.get(item_url, headers=headers) as response:
+            return response.status, await response.text()
+
+    async def close(self):
+        """Close the shared browser, HTTP session and Playwright driver"""
+        if self._http_session is not None:
+            try:
+                if hasattr(self._http_session, 'aclose'):
+                    await self._http_session.aclose()
+                else:
+                    await self._http_session.close()
+            except Exception as close_error:
+                logger.warning(f"[DEBUG] Error closing HTTP session: {close_error}")
+        self._http_session = None
+        for resource in (self._context, self._browser):
+            if resource is not None:
+                try:
+                    await resource.close()
+                except Exception as close_error:
+                    logger.warning(f"[DEBUG] Error closing browser: {close_error}")
+        if self._pw is not None:
+            try:
+                await self._pw.stop()
+            except Exception as close_error:
+                logger.warning(f"[DEBUG] Error stopping playwright: {close_error}")
+        self._pw = None
+        self._browser = None
+        self._context = None
+        self._warmed_games.clear()
+
+    async def __aenter__(self):
+        # The browser itself still launches lazily on first use; with the
+        # HTTP-first path a run may never need it at all
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def scrape_many(self, item_urls: List[str], concurrency: int = 8) -> List[Dict[str, Any]]:
+        """Scrape several items concurrently on the shared browser
+
+        Scraping is network/latency-bound, so overlapping navigations wins
+        back most of the per-item wait time; the semaphore caps how many
+        pages are in flight at once. The browser is not launched here:
+        scrape_with_fallback is HTTP-first, so Chromium only starts if
+        some item actually escalates to the browser path.
+        """
+        semaphore = asyncio.BoundedSemaphore(concurrency)
+
+        async def scrape_one(url: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.scrape_with_fallback(url)
+
+        return list(await asyncio.gather(*(scrape_one(url) for url in item_urls)))
+
+    async def _get_market_html(self, page) -> str:
+        """Fetch only the info-list and offers subtrees from the page
+
+        The market-data <dl> blocks and the seller table are a few KB out
+        of a document that can run to hundreds of KB; serializing just
+        those subtrees keeps the CDP transfer and the Python-side parsing
+        proportional to the data we actually extract.
+        """
+        try:
+            snippet = await page.evaluate("""() => {
+                const parts = [];
+                document.querySelectorAll('dl').forEach(el => parts.push(el.outerHTML));
+                const offers = document.querySelector('div.table-body');
+                if (offers) parts.push(offers.outerHTML);
+                return parts.join('\\n');
+            }""")
+            if isinstance(snippet, str) and snippet:
+                return snippet
+        except Exception as eval_error:
+            logger.warning(f"[DEBUG] Subtree extraction failed, falling back to full content: {eval_error}")
+
+        return await page.content()
+
+    async def scrape_item_price(self, item_url: str) -> Dict[str, Any]:
+        """Scrape price data for a single item"""
+        logger.info(f"[SCRAPE] Scraping: {item_url}")
+        logger.debug(f"[DEBUG] GitHub Actions: {self.is_github_actions}")
+
+        page = None
+        try:
+            context = await self._ensure_browser()
+            page = await context.new_page()
+            
+            # Response hook: bail immediately on the (vast) majority of
+            # responses that are not the product document itself
+            async def handle_response(response):
+                if response.url != item_url:
+                    return
+                logger.debug(f"[DEBUG] Response status: {response.status}")
+                if response.status == 403:
+                    logger.error(f"[DEBUG] 403 Forbidden for {response.url}")
+                    logger.error(f"[DEBUG] Request headers: {dict(response.request.headers)}")
+            
+            page.on('response', handle_response)
+            
+            # Determine game type from URL
+            game_type = "Magic" if "/Magic/" in item_url else "Pokemon"
+            logger.debug(f"[DEBUG] Detected game type: {game_type}")
+            
+            # Warm up cookies for this game section once per browser session
+            if game_type not in self._warmed_games:
+                async with self._warmup_lock:
+                    # Re-check under the lock; the first task warms the
+                    # game section, later arrivals skip straight through
+                    if game_type not in self._warmed_games:
+                        # Step 1: Visit homepage with enhanced delays for GitHub Actions
+                        logger.debug(f"[DEBUG] Step 1: Visiting homepage")
+                        homepage_response = await page.goto(f'{self.base_url}/', wait_until='domcontentloaded')
+                        logger.debug(f"[DEBUG] Homepage response: {homepage_response.status}")
+            
+                        # Longer delays for GitHub Actions
+                        delay = random.uniform(2, 4) if self.is_github_actions else random.uniform(1, 2)
+                        await asyncio.sleep(delay)
+            
+                        # Step 2: Navigate to game section
+                        game_url = f'{self.base_url}/en/{game_type}'
+                        logger.debug(f"[DEBUG] Step 2: Visiting game section: {game_url}")
+                        game_response = await page.goto(game_url, wait_until='domcontentloaded')
+                        logger.debug(f"[DEBUG] Game section response: {game_response.status}")
+            
+                        delay = random.uniform(2, 4) if self.is_github_actions else random.uniform(1, 2)
+                        await asyncio.sleep(delay)
+            
+                        self._warmed_games.add(game_type)
+
+            # Step 3: Navigate to product page, retrying with exponential
+            # backoff on 403 instead of sleeping unconditionally before
+            # every request
+            logger.debug(f"[DEBUG] Step 3: Visiting product page: {item_url}")
+            for attempt in range(3):
                 response = await page.goto(item_url, wait_until='domcontentloaded', timeout=30000)
-                logger.info(f"[DEBUG] Product page response: {response.status}")
-                
-                # Handle Cloudflare challenges
-                if response.status == 403 or 'cf-mitigated' in dict(response.headers):
-                    logger.info("[DEBUG] Detected Cloudflare challenge, waiting for resolution...")
-                    
-                    # Wait for potential challenge resolution
-                    try:
-                        await page.wait_for_load_state("networkidle", timeout=15000)
-                        await asyncio.sleep(3)  # Additional wait for JS execution
-                        
-                        # Check if we're still on a challenge page
-                        page_content = await page.content()
-                        if any(indicator in page_content.lower() for indicator in [
-                            'checking your browser', 'cloudflare', 'ddos protection', 
-                            'security check', 'please wait', 'ray id', 'challenge'
-                        ]):
-                            logger.info("[DEBUG] Still on challenge page, waiting longer...")
-                            await asyncio.sleep(5)
-                            
-                            # Try to reload the page
-                            logger.info("[DEBUG] Attempting page reload after challenge...")
-                            response = await page.reload(wait_until="domcontentloaded", timeout=30000)
-                            await page.wait_for_load_state("networkidle", timeout=10000)
-                            
-                    except Exception as e:
-                        logger.warning(f"[DEBUG] Challenge handling failed: {e}")
-                
-                if response.status != 200:
-                    error_msg = f"HTTP {response.status}"
-                    logger.error(f"[ERROR] Non-200 response: {error_msg}")
-                    
-                    # Try to get more details about the error
-                    try:
-                        page_content = await page.content()
-                        if "403" in page_content or "Forbidden" in page_content:
-                            logger.error(f"[DEBUG] Page contains 403/Forbidden content")
-                        if "blocked" in page_content.lower() or "bot" in page_content.lower():
-                            logger.error(f"[DEBUG] Page indicates bot detection")
-                    except Exception as content_error:
-                        logger.error(f"[DEBUG] Could not read page content: {content_error}")
-                    
-                    return {"status": "error", "error": error_msg}
-                
-                await page.wait_for_load_state('networkidle')
-                delay = random.uniform(2, 4) if self.is_github_actions else random.uniform(1, 2)
-                await asyncio.sleep(delay)
-                
-                # Extract data
-                page_text = await page.content()
-                
-                # Extract market data using improved regex patterns
-                available_items = self._extract_number(page_text, r'Available items</dt><dd[^>]*>(\d+)</dd>')
-                from_price = self._extract_price(page_text, r'From</dt><dd[^>]*>([\d,]+\.?\d*)\s*€</dd>')
-                price_trend = self._extract_price(page_text, r'Price Trend</dt><dd[^>]*><span>([\d,]+\.?\d*)\s*€</span></dd>')
-                avg_30_days = self._extract_price(page_text, r'30-days average price</dt><dd[^>]*><span>([\d,]+\.?\d*)\s*€</span></dd>')
-                avg_7_days = self._extract_price(page_text, r'7-days average price</dt><dd[^>]*><span>([\d,]+\.?\d*)\s*€</span></dd>')
-                avg_1_day = self._extract_price(page_text, r'1-day average price</dt><dd[^>]*><span>([\d,]+\.?\d*)\s*€</span></dd>')
-                
-                # Extract individual seller prices
-                seller_prices = self._extract_seller_prices(page_text)
-                
-                result = {
-                    "status": "success",
-                    "available_items": available_items,
-                    "from_price": from_price,
-                    "price_trend": price_trend,
-                    "avg_30_days": avg_30_days,
-                    "avg_7_days": avg_7_days,
-                    "avg_1_day": avg_1_day,
-                    "seller_prices": seller_prices,
-                    "min_seller_price": min(seller_prices) if seller_prices else None,
-                    "max_seller_price": max(seller_prices) if seller_prices else None,
-                    "seller_count": len(seller_prices),
-                    "scraped_at": datetime.utcnow()
-                }
-                
-                await browser.close()
-                logger.info(f"[SUCCESS] Successfully scraped: {item_url}")
-                return result
-                
-            except Exception as e:
-                error_msg = str(e)
-                logger.error(f"[ERROR] Error scraping {item_url}: {error_msg}")
-                
-                # Enhanced error logging for debugging
-                if "403" in error_msg or "Forbidden" in error_msg:
-                    logger.error(f"[DEBUG] 403 Forbidden error detected")
-                    logger.error(f"[DEBUG] User agent used: {user_agent}")
-                    logger.error(f"[DEBUG] GitHub Actions: {self.is_github_actions}")
-                elif "timeout" in error_msg.lower():
-                    logger.error(f"[DEBUG] Timeout error - may need longer delays")
-                elif "connection" in error_msg.lower():
-                    logger.error(f"[DEBUG] Connection error - network issue")
-                
+                logger.debug(f"[DEBUG] Product page response: {response.status}")
+                if response.status != 403 or attempt == 2:
+                    break
+                backoff = (2 ** attempt) + random.uniform(0, 1)
+                logger.warning(f"[DEBUG] 403 on attempt {attempt + 1}, retrying in {backoff:.1f}s")
+                await asyncio.sleep(backoff)
+
+            # Handle Cloudflare challenges
+            if response.status == 403 or 'cf-mitigated' in dict(response.headers):
+                logger.debug("[DEBUG] Detected Cloudflare challenge, waiting for resolution...")
+            
+                # Poll in-page for the challenge widgets to disappear
+                # instead of stacking fixed sleeps and networkidle waits;
+                # this returns the moment the challenge clears
+                try:
+                    await page.wait_for_function(
+                        f"""() => !document.querySelector({_CHALLENGE_SELECTORS!r})
+                            && !/just a moment|attention required/i.test(document.title)""",
+                        timeout=20000
+                    )
+                    # Reload once so the real product document replaces the
+                    # interstitial response we navigated into
+                    logger.debug("[DEBUG] Challenge cleared, reloading product page...")
+                    response = await page.reload(wait_until="domcontentloaded", timeout=30000)
+                    if await self._is_challenge_page(page):
+                        logger.warning("[DEBUG] Challenge still present after reload")
+                except Exception as e:
+                    logger.warning(f"[DEBUG] Challenge handling failed: {e}")
+            
+            if response.status != 200:
+                error_msg = f"HTTP {response.status}"
+                logger.error(f"[ERROR] Non-200 response: {error_msg}")
+            
+                # Try to get more details about the error
+                try:
+                    page_content = await page.content()
+                    if "403" in page_content or "Forbidden" in page_content:
+                        logger.error(f"[DEBUG] Page contains 403/Forbidden content")
+                    if "blocked" in page_content.lower() or "bot" in page_content.lower():
+                        logger.error(f"[DEBUG] Page indicates bot detection")
+                except Exception as content_error:
+                    logger.error(f"[DEBUG] Could not read page content: {content_error}")
+            
                 return {"status": "error", "error": error_msg}
             
-            finally:
+            # Wait only for the market-data block to exist rather than for
+            # the whole page (ads, trackers) to go network-quiet
+            try:
+                await page.wait_for_selector("dt:has-text('Price Trend')", timeout=10000)
+            except Exception:
+                logger.warning("[DEBUG] Price Trend block did not appear, extracting anyway")
+
+            # Extract data from just the subtrees we parse, avoiding a
+            # full-DOM serialization across the CDP wire
+            page_text = await self._get_market_html(page)
+
+            result = self._parse_product_html(page_text)
+
+
+            logger.info(f"[SUCCESS] Successfully scraped: {item_url}")
+            return result
+
+        except Exception as e:
+            error_msg = str(e)
+            logger.error(f"[ERROR] Error scraping {item_url}: {error_msg}")
+
+            # Enhanced error logging for debugging
+            if "403" in error_msg or "Forbidden" in error_msg:
+                logger.error(f"[DEBUG] 403 Forbidden error detected")
+                logger.error(f"[DEBUG] User agent used: {self._session_user_agent}")
+                logger.error(f"[DEBUG] GitHub Actions: {self.is_github_actions}")
+            elif "timeout" in error_msg.lower():
+                logger.error(f"[DEBUG] Timeout error - may need longer delays")
+            elif "connection" in error_msg.lower():
+                logger.error(f"[DEBUG] Connection error - network issue")
+
+            return {"status": "error", "error": error_msg}
+
+        finally:
+            if page is not None:
                 try:
-                    await browser.close()
-                    logger.info(f"[DEBUG] Browser closed successfully")
+                    await page.close()
                 except Exception as close_error:
-                     logger.warning(f"[DEBUG] Error closing browser: {close_error}")
-    
+                    logger.warning(f"[DEBUG] Error closing page: {close_error}")
+
     async def _fallback_http_scrape(self, item_url: str) -> Dict[str, Any]:
         """Fallback HTTP-based scraping when browser method fails"""
         logger.info(f"[FALLBACK] Attempting HTTP fallback for: {item_url}")
@@ -506,115 +747,199 @@ class CardMarketScraper:
         headers['User-Agent'] = user_agent
         
         try:
-            timeout = aiohttp.ClientTimeout(total=30)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                # Add random delay
-                await asyncio.sleep(random.uniform(1, 3))
-                
-                async with session.get(item_url, headers=headers) as response:
-                    logger.info(f"[FALLBACK] HTTP response status: {response.status}")
-                    
-                    if response.status == 403:
-                        logger.error(f"[FALLBACK] HTTP 403 - also blocked via direct HTTP")
-                        return {"status": "error", "error": "HTTP 403"}
-                    elif response.status != 200:
-                        return {"status": "error", "error": f"HTTP {response.status}"}
-                    
-                    content = await response.text()
-                    logger.info(f"[FALLBACK] Retrieved {len(content)} characters")
-                    
-                    # Try to extract basic data from HTML
-                    available_items = self._extract_number(content, r'Available items</dt><dd[^>]*>(\d+)</dd>')
-                    from_price = self._extract_price(content, r'From</dt><dd[^>]*>([\d,]+\.?\d*)\s*€</dd>')
-                    
-                    if available_items is not None or from_price is not None:
-                        logger.info(f"[FALLBACK] Successfully extracted some data")
-                        return {
-                            "status": "success",
-                            "available_items": available_items,
-                            "from_price": from_price,
-                            "price_trend": None,
-                            "avg_30_days": None,
-                            "avg_7_days": None,
-                            "avg_1_day": None,
-                            "seller_prices": [],
-                            "min_seller_price": None,
-                            "max_seller_price": None,
-                            "seller_count": 0,
-                            "scraped_at": datetime.utcnow(),
-                            "method": "http_fallback"
-                        }
-                    else:
-                        logger.warning(f"[FALLBACK] Could not extract data from HTTP response")
-                        return {"status": "error", "error": "No data extracted"}
-                        
+            status, content = await self._http_get(item_url, headers)
+            logger.info(f"[FALLBACK] HTTP response status: {status}")
+
+            if status == 403:
+                logger.error(f"[FALLBACK] HTTP 403 - also blocked via direct HTTP")
+                return {"status": "error", "error": "HTTP 403"}
+            elif status != 200:
+                return {"status": "error", "error": f"HTTP {status}"}
+
+            logger.info(f"[FALLBACK] Retrieved {len(content)} characters")
+
+            if 'cf-browser-verification' in content or 'Just a moment' in content:
+                logger.warning(f"[FALLBACK] Cloudflare challenge served over plain HTTP")
+                return {"status": "error", "error": "Cloudflare challenge"}
+
+            # Full extraction: a non-challenged HTTP response carries the
+            # same markup the browser would render
+            result = self._parse_product_html(content)
+
+            if any(result[name] is not None for name in _MARKET_PATTERNS):
+                logger.info(f"[FALLBACK] Successfully extracted some data")
+                result["method"] = "http_fallback"
+                return result
+            else:
+                logger.warning(f"[FALLBACK] Could not extract data from HTTP response")
+                return {"status": "error", "error": "No data extracted"}
+
         except Exception as e:
             logger.error(f"[FALLBACK] HTTP fallback failed: {e}")
             return {"status": "error", "error": f"Fallback failed: {str(e)}"}
     
     async def scrape_with_fallback(self, item_url: str) -> Dict[str, Any]:
-        """Main scraping method with fallback support"""
-        # Try browser-based scraping first
-        result = await self.scrape_item_price(item_url)
-        
-        # If browser method fails with 403, try HTTP fallback
-        if result.get("status") == "error" and "403" in str(result.get("error", "")):
-            logger.info(f"[FALLBACK] Browser method failed with 403, trying HTTP fallback")
-            fallback_result = await self._fallback_http_scrape(item_url)
-            
-            # If fallback also fails, return original error with more context
-            if fallback_result.get("status") == "error":
-                result["error"] = f"Browser: {result.get('error')}, Fallback: {fallback_result.get('error')}"
-                logger.error(f"[FALLBACK] Both methods failed for {item_url}")
-            else:
-                logger.info(f"[FALLBACK] HTTP fallback succeeded for {item_url}")
-                return fallback_result
-        
+        """Main scraping method: cheap HTTP fetch first, browser on block
+
+        A plain HTTP GET is an order of magnitude cheaper than a browser
+        navigation and usually succeeds, so the expensive Playwright path
+        is only taken when the HTTP attempt is blocked or comes back empty.
+        Successful results are cached per URL for a few minutes so repeated
+        lookups in the same run skip the network entirely.
+        """
+        cached = self._result_cache.get(item_url)
+        if cached is not None:
+            cached_at, cached_result = cached
+            if time.monotonic() - cached_at < self._result_cache_ttl:
+                logger.info(f"[CACHE] Reusing recent result for {item_url}")
+                return dict(cached_result)
+            del self._result_cache[item_url]
+
+        result = await self._fallback_http_scrape(item_url)
+        if result.get("status") == "success":
+            self._result_cache[item_url] = (time.monotonic(), result)
+            return result
+
+        logger.info(f"[FALLBACK] HTTP attempt failed ({result.get('error')}), escalating to browser")
+        browser_result = await self.scrape_item_price(item_url)
+
+        if browser_result.get("status") == "error":
+            browser_result["error"] = (
+                f"HTTP: {result.get('error')}, Browser: {browser_result.get('error')}"
+            )
+            logger.error(f"[FALLBACK] Both methods failed for {item_url}")
+        else:
+            self._result_cache[item_url] = (time.monotonic(), browser_result)
+        return browser_result
+
+    def _parse_product_html(self, html: str) -> Dict[str, Any]:
+        """Parse product HTML into a complete result dict (pure CPU)
+
+        Kept free of any I/O so it could be pushed to an executor if
+        parsing ever dominated; with subtree extraction the inputs are a
+        few KB, so it runs inline today.
+        """
+        result = {"status": "success"}
+        result.update(self._extract_market_data(html))
+
+        seller_prices = self._extract_seller_prices(html)
+        result["seller_prices"] = seller_prices
+        result["min_seller_price"] = min(seller_prices) if seller_prices else None
+        result["max_seller_price"] = max(seller_prices) if seller_prices else None
+        result["seller_count"] = len(seller_prices)
+        result["scraped_at"] = datetime.utcnow()
         return result
-    
+
+    def _extract_market_data(self, text: str) -> Dict[str, Any]:
+        """Extract all market-data fields in a single pass over the HTML"""
+        fields = {name: None for name in self._patterns}
+        for match in self._market_pattern.finditer(text):
+            field = match.lastgroup
+            if field is None:
+                continue
+            if field.endswith('_v'):
+                field = field[:-2]
+            if fields[field] is not None:
+                continue  # Keep the first occurrence, like re.search did
+            value = match.group(field + '_v')
+            if field == 'available_items':
+                fields[field] = int(value.replace(',', ''))
+            else:
+                fields[field] = self._parse_price_str(value)
+        return fields
+
+    # Translation tables for price normalization; a single str.translate
+    # call is cheaper than chained replace() on the hot parse path
+    _EU_TO_FLOAT = str.maketrans({',': '.', '.': None})
+    _NO_COMMA = str.maketrans('', '', ',')
+
+    def _parse_price_str(self, price_str: str) -> float:
+        """Normalize a European/US formatted price string to float
+
+        The rightmost of ','/'.' is the decimal separator, which decides
+        the format in one comparison: 127,00 and 1.234,56 are European,
+        1,234.56 and 127.00 are US.
+        """
+        if price_str.rfind(',') > price_str.rfind('.'):
+            return float(price_str.translate(self._EU_TO_FLOAT))
+        return float(price_str.translate(self._NO_COMMA))
+
     def _extract_number(self, text: str, pattern: str) -> Optional[int]:
         """Extract number using regex pattern"""
         match = re.search(pattern, text)
         if match:
-            return int(match.group(1).replace(',', ''))
+            return int(match.group(1).translate(self._NO_COMMA))
         return None
     
     def _extract_price(self, text: str, pattern: str) -> Optional[float]:
         """Extract price using regex pattern"""
         match = re.search(pattern, text)
         if match:
-            price_str = match.group(1)
-            # Handle European format: 127,00 -> 127.00
-            if ',' in price_str and '.' not in price_str:
-                price_str = price_str.replace(',', '.')
-            # Handle thousands separator: 1,234.56 -> 1234.56
-            elif ',' in price_str and '.' in price_str:
-                price_str = price_str.replace(',', '')
-            return float(price_str)
+            return self._parse_price_str(match.group(1))
         return None
     
     def _extract_seller_prices(self, text: str) -> List[float]:
         """Extract individual seller prices"""
-        price_pattern = r'(\d+,?\d*\.?\d*)\s*€'
-        matches = re.findall(price_pattern, text)
-        
+        # Prefer a DOM query scoped to the seller rows so we only look at
+        # the offers table instead of every euro amount on the page
+        if HTMLParser is not None:
+            tree = HTMLParser(text)
+            nodes = tree.css('div.article-row div.price-container')
+            if nodes:
+                matches = []
+                for node in nodes:
+                    matches.extend(self._seller_price_pattern.findall(node.text()))
+                return self._filter_seller_prices(matches)
+
+        # Fallback: narrow the scan to the offers-table region first; the
+        # rest of the document (menus, scripts, footer) carries euro
+        # amounts we would only have to filter back out
+        start = text.find('article-row')
+        if start >= 0:
+            end = text.find('</table>', start)
+            text = text[start:end] if end >= 0 else text[start:]
+
+        # Stream matches with finditer, capping the scan at 200 unique
+        # in-range prices rather than materializing every euro amount in
+        # the region; returning the 50 smallest of those matches the
+        # selectolax path (np.unique(...)[:50]) so min/max agree between
+        # the two extractors instead of reflecting document order
+        unique = set()
+        seen_strs = set()
+        for match in self._seller_price_pattern.finditer(text):
+            price_str = match.group(1)
+            # Offers repeat the same price dozens of times; dedupe the
+            # raw string so each distinct price is float-parsed once
+            if price_str in seen_strs:
+                continue
+            seen_strs.add(price_str)
+            try:
+                price = self._parse_price_str(price_str)
+            except ValueError:
+                continue
+            if 10 <= price <= 10000:  # Reasonable price range
+                unique.add(price)
+                if len(unique) >= 200:  # Bound the scan on huge offer tables
+                    break
+        return sorted(unique)[:50]  # Limit to 50 prices
+
+    def _filter_seller_prices(self, matches: List[str]) -> List[float]:
+        """Parse, range-filter, dedupe and sort raw seller price strings"""
+        # Dedupe the raw strings first so repeated offers at the same
+        # price cost one float parse instead of one per occurrence
         prices = []
-        for match in matches:
+        for match in set(matches):
             try:
-                price_str = match
-                # Handle European format: 127,00 -> 127.00
-                if ',' in price_str and '.' not in price_str:
-                    price_str = price_str.replace(',', '.')
-                # Handle thousands separator: 1,234.56 -> 1234.56
-                elif ',' in price_str and '.' in price_str:
-                    price_str = price_str.replace(',', '')
-                
-                price = float(price_str)
-                if 10 <= price <= 10000:  # Reasonable price range
-                    prices.append(price)
+                prices.append(self._parse_price_str(match))
             except ValueError:
                 continue
-        
-        # Remove duplicates and sort
-        unique_prices = sorted(list(set(prices)))
-        return unique_prices[:50]  # Limit to 50 prices
\ No newline at end of file
+
+        # Range-filter, dedupe and sort in vectorized NumPy ops when
+        # available; pages can carry hundreds of seller prices
+        if np is not None:
+            arr = np.asarray(prices, dtype=np.float64)
+            arr = arr[(arr >= 10) & (arr <= 10000)]  # Reasonable price range
+            return np.unique(arr)[:50].tolist()  # Limit to 50 prices
+
+        filtered = [p for p in prices if 10 <= p <= 10000]
+        return sorted(set(filtered))[:50]
\ No newline at end of file
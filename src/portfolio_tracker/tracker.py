@@ -1,67 +1,162 @@
 """Main portfolio tracker orchestrator"""
 
 import csv
+import time
 import asyncio
-import random
+import functools
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 from pathlib import Path
+from urllib.parse import urlparse
 
 from .csv_storage import CSVStorageManager
 from .scraper import CardMarketScraper
 
 logger = logging.getLogger(__name__)
 
+# Configure logging once at import; instantiating trackers repeatedly
+# (e.g. in test setUp) no longer re-runs basicConfig
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
+
+class _TokenBucket:
+    """Minimal async token bucket allowing `rate` requests per `per` seconds
+
+    Replaces fixed inter-request sleeps: a request proceeds immediately
+    while tokens remain and only waits for the exact refill time when the
+    bucket is empty.
+    """
+
+    def __init__(self, rate: int = 10, per: float = 60.0):
+        self.capacity = rate
+        self.fill_rate = rate / per
+        self.tokens = float(rate)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (now - self.updated) * self.fill_rate
+                )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.fill_rate)
+
+
+def _parse_portfolio_stream(stream) -> Iterator[Dict[str, Any]]:
+    """Yield portfolio items from an open CSV text stream
+
+    Working on a stream rather than a path keeps the parser free of
+    filesystem concerns: callers can feed it a real file or an in-memory
+    buffer such as io.StringIO.
+    """
+    try:
+        reader = csv.DictReader(stream)
+        # Strip any BOM from the header once so the row loop can
+        # use plain key access instead of per-row BOM guards
+        if reader.fieldnames:
+            reader.fieldnames = [fn.lstrip('\ufeff') for fn in reader.fieldnames]
+        count = 0
+        for row in reader:
+            price_value = row.get('Price')
+            item = {
+                'link': row.get('Link', '').strip(),
+                'name': row.get('Name', '').strip(),
+                'purchase_date': row.get('Date', '').strip(),
+                'quantity': int(row.get('Quantity', 1)),
+                'purchase_price': float(price_value) if price_value else None
+            }
+
+            if item['link'] and item['name']:
+                logger.info(f"[LOAD] Loaded: {item['name']}")
+                count += 1
+                yield item
+            else:
+                logger.warning(f"[SKIP] Skipping item with missing link or name: {item}")
+
+        logger.info(f"[SUCCESS] Loaded {count} items from CSV")
+
+    except Exception as e:
+        logger.error(f"[ERROR] Error loading CSV: {e}")
+
+
+def _iter_portfolio_rows(csv_path: str) -> Iterator[Dict[str, Any]]:
+    """Yield portfolio items from a CSV file one row at a time
+
+    Streaming keeps memory flat for large portfolios and lets callers
+    start work while later rows are still being parsed.
+    """
+    csv_file = Path(csv_path)
+
+    if not csv_file.exists():
+        logger.error(f"[ERROR] Portfolio CSV file not found: {csv_path}")
+        return
+
+    try:
+        with open(csv_file, 'r', encoding='utf-8') as file:
+            yield from _parse_portfolio_stream(file)
+    except OSError as e:
+        logger.error(f"[ERROR] Error loading CSV: {e}")
+
+
+@functools.lru_cache(maxsize=8)
+def _load_cached_portfolio(csv_path: str, mtime: float) -> tuple:
+    """Parse a portfolio CSV once per (path, mtime) pair
+
+    mtime participates only in the cache key: a rewritten file gets a
+    fresh mtime and therefore a cache miss, so stale reads are impossible
+    while repeat loads of an unchanged file skip the parse entirely.
+    """
+    return tuple(_iter_portfolio_rows(csv_path))
+
 
 class PortfolioTracker:
     """Main portfolio tracking orchestrator"""
-    
+
     def __init__(self, data_dir: str = "data", csv_path: str = "portfolio.csv"):
         self.storage_manager = CSVStorageManager(data_dir)
         self.scraper = CardMarketScraper()
         self.csv_path = csv_path
-        
-        # Setup logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s'
-        )
-    
-    def load_portfolio_from_csv(self) -> List[Dict[str, Any]]:
-        """Load portfolio items from CSV file"""
-        portfolio_items = []
-        csv_file = Path(self.csv_path)
-        
-        if not csv_file.exists():
-            logger.error(f"[ERROR] Portfolio CSV file not found: {self.csv_path}")
-            return portfolio_items
-        
+        self._host_limiters: Dict[str, _TokenBucket] = {}
+
+    def iter_portfolio_from_csv(self, csv_stream=None) -> Iterator[Dict[str, Any]]:
+        """Yield portfolio items from the CSV file one row at a time
+
+        Pass csv_stream to parse an already-open text stream (e.g. an
+        io.StringIO) instead of reading self.csv_path from disk.
+        """
+        if csv_stream is not None:
+            yield from _parse_portfolio_stream(csv_stream)
+        else:
+            yield from _iter_portfolio_rows(self.csv_path)
+
+    def load_portfolio_from_csv(self, csv_stream=None) -> List[Dict[str, Any]]:
+        """Load portfolio items from CSV file
+
+        Repeat loads of an unchanged file come from the parse cache; rows
+        are shallow-copied per call so callers may mutate them freely.
+        A csv_stream is parsed directly and never cached: streams are
+        one-shot and carry no path/mtime identity to key on.
+        """
+        if csv_stream is not None:
+            return list(_parse_portfolio_stream(csv_stream))
         try:
-            with open(csv_file, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    # Handle BOM in column names
-                    link_value = row.get('Link', '') or row.get('\ufeffLink', '')
-                    item = {
-                        'link': link_value.strip(),
-                        'name': row.get('Name', '').strip(),
-                        'purchase_date': row.get('Date', '').strip(),
-                        'quantity': int(row.get('Quantity', 1)),
-                        'purchase_price': float(row.get('Price', 0)) if row.get('Price') else None
-                    }
-                    
-                    if item['link'] and item['name']:
-                        portfolio_items.append(item)
-                        logger.info(f"[LOAD] Loaded: {item['name']}")
-                    else:
-                        logger.warning(f"[SKIP] Skipping item with missing link or name: {item}")
-            
-            logger.info(f"[SUCCESS] Loaded {len(portfolio_items)} items from CSV")
-            
-        except Exception as e:
-            logger.error(f"[ERROR] Error loading CSV: {e}")
-        
-        return portfolio_items
+            mtime = Path(self.csv_path).stat().st_mtime
+        except OSError:
+            # Missing file: the streaming path logs the error and yields
+            # nothing, and the failure is not worth a cache slot
+            return list(self.iter_portfolio_from_csv())
+        return [dict(item) for item in _load_cached_portfolio(self.csv_path, mtime)]
     
     async def track_all_items(self):
         """Track prices for all items in portfolio"""
@@ -77,41 +172,71 @@ class PortfolioTracker:
         self.storage_manager.sync_portfolio_items(portfolio_items)
         logger.info("[SUCCESS] Portfolio synced to CSV storage")
         
-        # Get items from CSV storage for tracking
-        stored_items = self.storage_manager.get_portfolio_items()
-        
-        # Track each item
-        for item in stored_items:
-            try:
-                logger.info(f"[TRACK] Tracking: {item['name']}")
-                price_data = await self.scraper.scrape_with_fallback(item['link'])
-                self.storage_manager.save_price_data(int(item['id']), item['name'], price_data)
-                
-                # Add delay between requests
-                await asyncio.sleep(random.uniform(3, 6))
-                
-            except Exception as e:
-                logger.error(f"[ERROR] Error tracking {item['name']}: {e}")
-        
+        # Get items from CSV storage for tracking, skipping stale rows
+        # without a link and duplicate links before any scrape is scheduled
+        stored_items = []
+        seen_links = set()
+        for item in self.storage_manager.get_portfolio_items():
+            link = item.get('link')
+            if not link:
+                logger.warning(f"[SKIP] No link for stored item: {item.get('name')}")
+                continue
+            if link in seen_links:
+                logger.info(f"[SKIP] Duplicate link already scheduled: {link}")
+                continue
+            seen_links.add(link)
+            stored_items.append(item)
+
+
+        # Track items concurrently, scoping the shared browser/session to
+        # this run; the semaphore bounds how many scrapes are in flight
+        semaphore = asyncio.BoundedSemaphore(8)
+
+        async def track_one(item):
+            async with semaphore:
+                try:
+                    # Throttle per host: different hosts proceed
+                    # independently instead of sharing one fixed delay
+                    host = urlparse(item['link']).netloc
+                    limiter = self._host_limiters.setdefault(host, _TokenBucket(10, 60.0))
+                    await limiter.acquire()
+
+                    logger.info(f"[TRACK] Tracking: {item['name']}")
+                    price_data = await self.scraper.scrape_with_fallback(item['link'])
+                    return (item['id'], item['name'], price_data)
+
+                except Exception as e:
+                    logger.error(f"[ERROR] Error tracking {item['name']}: {e}")
+                    return None
+
+        async with self.scraper:
+            results = await asyncio.gather(*(track_one(item) for item in stored_items))
+
+        # Persist the whole run as one batched write
+        self.storage_manager.save_price_data_batch(
+            [row for row in results if row is not None]
+        )
         logger.info("[COMPLETE] Portfolio tracking completed!")
     
     def get_portfolio_summary(self) -> Dict[str, Any]:
         """Get portfolio summary with latest prices"""
         items = self.storage_manager.get_portfolio_items()
-        summary = {
+
+        # One pass over the price index instead of a lookup per item; the
+        # walrus binding reuses each latest_map lookup for both fields
+        latest_map = self.storage_manager.get_latest_prices_by_id()
+        return {
             'total_items': len(items),
-            'items': []
-        }
-        
-        for item in items:
-            latest_price = self.storage_manager.get_latest_price_data(int(item['id']))
-            item_summary = {
-                'name': item['name'],
-                'quantity': item['quantity'],
-                'purchase_price': item['purchase_price'],
-                'current_price': latest_price['from_price'] if latest_price else None,
-                'last_updated': latest_price['scraped_at'] if latest_price else None
-            }
-            summary['items'].append(item_summary)
-        
-        return summary
\ No newline at end of file
+            'items': [
+                {
+                    'name': item['name'],
+                    'quantity': item['quantity'],
+                    'purchase_price': item['purchase_price'],
+                    'current_price': latest_price['from_price'] if (
+                        latest_price := latest_map.get(item['id'])
+                    ) else None,
+                    'last_updated': latest_price['scraped_at'] if latest_price else None
+                }
+                for item in items
+            ]
+        }
\ No newline at end of file
@@ -0,0 +1,18 @@
+"""Shared pytest configuration for the test suite
+
+Puts src/ on sys.path once per process so every test module (and every
+pytest-xdist worker) resolves portfolio_tracker without its own path
+mutation, and so the suite can run as `pytest -n auto` from any
+directory.
+
+Temp-file isolation for parallel workers needs no extra naming: each
+test builds its fixtures inside tempfile.TemporaryDirectory(), whose
+mkdtemp naming is already unique per process and per worker.
+"""
+
+import sys
+from pathlib import Path
+
+_SRC = str(Path(__file__).parent.parent / "src")
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
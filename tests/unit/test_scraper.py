@@ -2,11 +2,6 @@
 
 import unittest
 from unittest.mock import patch, MagicMock, AsyncMock
-import asyncio
-
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
 from portfolio_tracker.scraper import CardMarketScraper
 
@@ -79,7 +74,14 @@ class TestCardMarketScraper(unittest.TestCase):
         
         result = self.scraper._extract_seller_prices(html_text)
         self.assertEqual(result, [])
-    
+
+
+class TestCardMarketScraperAsync(unittest.IsolatedAsyncioTestCase):
+    """Async test cases for CardMarketScraper"""
+
+    def setUp(self):
+        self.scraper = CardMarketScraper()
+
     @patch('portfolio_tracker.scraper.async_playwright')
     async def test_scrape_item_price_success(self, mock_playwright):
         """Test successful item price scraping"""
@@ -90,7 +92,7 @@ class TestCardMarketScraper(unittest.TestCase):
         mock_page = AsyncMock()
         mock_response = MagicMock()
         
-        mock_playwright.return_value.__aenter__.return_value = mock_p
+        mock_playwright.return_value.start = AsyncMock(return_value=mock_p)
         mock_p.chromium.launch.return_value = mock_browser
         mock_browser.new_context.return_value = mock_context
         mock_context.new_page.return_value = mock_page
@@ -128,7 +130,7 @@ class TestCardMarketScraper(unittest.TestCase):
         mock_page = AsyncMock()
         mock_response = MagicMock()
         
-        mock_playwright.return_value.__aenter__.return_value = mock_p
+        mock_playwright.return_value.start = AsyncMock(return_value=mock_p)
         mock_p.chromium.launch.return_value = mock_browser
         mock_browser.new_context.return_value = mock_context
         mock_context.new_page.return_value = mock_page
@@ -156,28 +158,7 @@ class TestCardMarketScraper(unittest.TestCase):
         self.assertIn('Network error', result['error'])
 
 
-class AsyncTestCase(unittest.TestCase):
-    """Base class for async test cases"""
-    
-    def setUp(self):
-        self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.loop)
-    
-    def tearDown(self):
-        self.loop.close()
-    
-    def async_test(self, coro):
-        return self.loop.run_until_complete(coro)
-
-
-class TestCardMarketScraperAsync(AsyncTestCase):
-    """Async test cases for CardMarketScraper"""
-    
-    def setUp(self):
-        super().setUp()
-        self.scraper = CardMarketScraper()
-    
-    def test_scrape_item_price_success_async(self):
+    async def test_scrape_item_price_success_async(self):
         """Test successful scraping (async version)"""
         with patch('portfolio_tracker.scraper.async_playwright') as mock_playwright:
             # Setup mocks
@@ -186,20 +167,17 @@ class TestCardMarketScraperAsync(AsyncTestCase):
             mock_context = AsyncMock()
             mock_page = AsyncMock()
             mock_response = MagicMock()
-            
-            mock_playwright.return_value.__aenter__.return_value = mock_p
+
+            mock_playwright.return_value.start = AsyncMock(return_value=mock_p)
             mock_p.chromium.launch.return_value = mock_browser
             mock_browser.new_context.return_value = mock_context
             mock_context.new_page.return_value = mock_page
             mock_page.goto.return_value = mock_response
             mock_response.status = 200
             mock_page.content.return_value = '<dt>Available items</dt><dd>50</dd>'
-            
-            # Run async test
-            result = self.async_test(
-                self.scraper.scrape_item_price('https://example.com/magic/card')
-            )
-            
+
+            result = await self.scraper.scrape_item_price('https://example.com/magic/card')
+
             self.assertEqual(result['status'], 'success')
             self.assertEqual(result['available_items'], 50)
 
@@ -2,177 +2,172 @@
 
 import unittest
 import tempfile
-import os
-import csv
-from unittest.mock import patch, MagicMock, AsyncMock
+import shutil
+import io
 from pathlib import Path
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
 from portfolio_tracker.tracker import PortfolioTracker
 
+# Static portfolio fixture written verbatim in setUp; a precomputed
+# bytes literal skips csv.writer's quoting/dialect machinery for data
+# that never changes
+_CSV_BYTES = (
+    b'Link,Name,Date,Quantity,Price\n'
+    b'https://example.com/card1,Test Card 1,2024-01-01,2,10.50\n'
+    b'https://example.com/card2,Test Card 2,2024-01-02,1,25.00\n'
+)
+
+
+class FakeStorageManager:
+    """Plain-Python storage fake recording calls in a list
+
+    Cheaper and more explicit than MagicMock: no __getattr__ dispatch or
+    call-recording machinery, just attribute access and appends.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def sync_portfolio_items(self, items):
+        self.calls.append(('sync_portfolio_items', items))
+
+    def get_portfolio_items(self):
+        self.calls.append(('get_portfolio_items', None))
+        return [{
+            'id': 1,
+            'name': 'Test Card 1',
+            'link': 'https://example.com/card1',
+            'quantity': 1,
+            'purchase_price': 10.00
+        }]
+
+    def save_price_data_batch(self, rows):
+        self.calls.append(('save_price_data_batch', rows))
+
+
+class FakeScraper:
+    """Plain-Python scraper fake with real async methods"""
+
+    def __init__(self):
+        self.scraped = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return None
+
+    async def scrape_with_fallback(self, item_url):
+        self.scraped.append(item_url)
+        return {
+            'status': 'success',
+            'from_price': 12.50,
+            'available_items': 100
+        }
+
 
 class TestPortfolioTracker(unittest.TestCase):
     """Test cases for PortfolioTracker"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build the portfolio CSV template once for the whole class"""
+        cls._template_dir = tempfile.TemporaryDirectory()
+        cls._template_csv = Path(cls._template_dir.name) / 'portfolio.csv'
+        cls._template_csv.write_bytes(_CSV_BYTES)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._template_dir.cleanup()
+
     def setUp(self):
-        """Set up test tracker"""
-        # Create temporary database
-        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
-        self.temp_db.close()
-        
-        # Create temporary CSV
-        self.temp_csv = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv', newline='')
-        csv_writer = csv.writer(self.temp_csv)
-        csv_writer.writerow(['link', 'name', 'purchase_date', 'quantity', 'purchase_price'])
-        csv_writer.writerow([
-            'https://example.com/card1',
-            'Test Card 1',
-            '2024-01-01',
-            '2',
-            '10.50'
-        ])
-        csv_writer.writerow([
-            'https://example.com/card2',
-            'Test Card 2',
-            '2024-01-02',
-            '1',
-            '25.00'
-        ])
-        self.temp_csv.close()
-        
+        """Give each test a fresh copy of the class-level template"""
+        self._work_dir = tempfile.TemporaryDirectory()
+        self.temp_csv_path = str(Path(self._work_dir.name) / 'portfolio.csv')
+        shutil.copyfile(self._template_csv, self.temp_csv_path)
+        self.data_dir = str(Path(self._work_dir.name) / 'data')
+
         self.tracker = PortfolioTracker(
-            db_path=self.temp_db.name,
-            csv_path=self.temp_csv.name
+            data_dir=self.data_dir,
+            csv_path=self.temp_csv_path
         )
-    
+
     def tearDown(self):
-        """Clean up temporary files"""
-        # Close database connections
-        if hasattr(self.tracker, 'db_manager') and self.tracker.db_manager:
-            self.tracker.db_manager.close()
-        
-        # Clean up temporary files
-        try:
-            os.unlink(self.temp_db.name)
-        except (PermissionError, FileNotFoundError):
-            pass  # File may already be deleted or in use
-        
-        try:
-            os.unlink(self.temp_csv.name)
-        except (PermissionError, FileNotFoundError):
-            pass  # File may already be deleted or in use
+        """Clean up the per-test working directory"""
+        self._work_dir.cleanup()
     
     def test_load_portfolio_from_csv(self):
         """Test loading portfolio from CSV"""
         items = self.tracker.load_portfolio_from_csv()
-        
+
         self.assertEqual(len(items), 2)
-        
-        item1 = items[0]
-        self.assertEqual(item1['name'], 'Test Card 1')
-        self.assertEqual(item1['link'], 'https://example.com/card1')
-        self.assertEqual(item1['quantity'], 2)
-        self.assertEqual(item1['purchase_price'], 10.50)
-        
-        item2 = items[1]
-        self.assertEqual(item2['name'], 'Test Card 2')
-        self.assertEqual(item2['quantity'], 1)
-        self.assertEqual(item2['purchase_price'], 25.00)
+
+        # One dict comparison per row via subTest: a failing row reports
+        # all its mismatched fields at once without stopping the loop,
+        # and the pattern scales to larger fixtures
+        expected = [
+            {
+                'name': 'Test Card 1',
+                'link': 'https://example.com/card1',
+                'quantity': 2,
+                'purchase_price': 10.50
+            },
+            {
+                'name': 'Test Card 2',
+                'quantity': 1,
+                'purchase_price': 25.00
+            },
+        ]
+        for exp, got in zip(expected, items):
+            with self.subTest(name=exp['name']):
+                self.assertEqual({key: got[key] for key in exp}, exp)
     
     def test_load_portfolio_from_csv_missing_file(self):
         """Test loading portfolio from non-existent CSV"""
-        tracker = PortfolioTracker(csv_path='nonexistent.csv')
+        # Reuse the per-test data_dir so the default "data" directory is
+        # never created in the working directory as a side effect
+        tracker = PortfolioTracker(
+            data_dir=self.data_dir,
+            csv_path=str(Path(self._work_dir.name) / 'nonexistent.csv')
+        )
         items = tracker.load_portfolio_from_csv()
-        
+
         self.assertEqual(len(items), 0)
     
     def test_load_portfolio_from_csv_invalid_data(self):
         """Test loading portfolio with invalid CSV data"""
-        # Create CSV with invalid data
-        temp_csv = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv', newline='')
-        csv_writer = csv.writer(temp_csv)
-        csv_writer.writerow(['link', 'name', 'quantity', 'purchase_price'])
-        csv_writer.writerow(['', 'Empty Link', '1', '10.00'])  # Empty link
-        csv_writer.writerow(['https://example.com/card', '', '1', '10.00'])  # Empty name
-        csv_writer.writerow(['https://example.com/valid', 'Valid Card', 'invalid', '10.00'])  # Invalid quantity
-        temp_csv.close()
-        
-        try:
-            tracker = PortfolioTracker(csv_path=temp_csv.name)
-            items = tracker.load_portfolio_from_csv()
-            
-            # Should skip invalid entries
-            self.assertEqual(len(items), 0)
-        finally:
-            os.unlink(temp_csv.name)
-    
-    @patch('portfolio_tracker.tracker.PortfolioTracker.load_portfolio_from_csv')
-    @patch('portfolio_tracker.tracker.DatabaseManager')
-    @patch('portfolio_tracker.tracker.CardMarketScraper')
-    async def test_track_all_items(self, mock_scraper_class, mock_db_class, mock_load_csv):
-        """Test tracking all items"""
-        # Mock CSV loading
-        mock_load_csv.return_value = [
-            {
-                'link': 'https://example.com/card1',
-                'name': 'Test Card 1',
-                'quantity': 1,
-                'purchase_price': 10.00
-            }
-        ]
-        
-        # Mock database
-        mock_db = MagicMock()
-        mock_db_class.return_value = mock_db
-        
-        mock_item = MagicMock()
-        mock_item.id = 1
-        mock_item.name = 'Test Card 1'
-        mock_item.link = 'https://example.com/card1'
-        mock_db.get_portfolio_items.return_value = [mock_item]
-        
-        # Mock scraper
-        mock_scraper = AsyncMock()
-        mock_scraper_class.return_value = mock_scraper
-        mock_scraper.scrape_item_price.return_value = {
-            'status': 'success',
-            'from_price': 12.50,
-            'available_items': 100
-        }
-        
-        # Create tracker with mocked dependencies
-        tracker = PortfolioTracker()
-        tracker.db_manager = mock_db
-        tracker.scraper = mock_scraper
-        
-        # Track items
-        await tracker.track_all_items()
-        
-        # Verify calls
-        mock_load_csv.assert_called_once()
-        mock_db.sync_portfolio_items.assert_called_once()
-        mock_db.get_portfolio_items.assert_called_once()
-        mock_scraper.scrape_item_price.assert_called_once_with('https://example.com/card1')
-        mock_db.save_price_data.assert_called_once()
+        # Build the invalid CSV in memory: the parser works on any text
+        # stream, so no temp file round trip is needed
+        csv_stream = io.StringIO(
+            'Link,Name,Date,Quantity,Price\n'
+            ',Empty Link,2024-01-01,1,10.00\n'  # Empty link
+            'https://example.com/card,,2024-01-01,1,10.00\n'  # Empty name
+            'https://example.com/valid,Valid Card,2024-01-01,invalid,10.00\n'  # Invalid quantity
+        )
+
+        items = self.tracker.load_portfolio_from_csv(csv_stream=csv_stream)
+
+        # Should skip invalid entries
+        self.assertEqual(len(items), 0)
     
     def test_get_portfolio_summary(self):
         """Test getting portfolio summary"""
-        # Load items into database
+        # Load items into storage
         items = self.tracker.load_portfolio_from_csv()
-        self.tracker.db_manager.sync_portfolio_items(items)
-        
-        # Add some price data
-        db_items = self.tracker.db_manager.get_portfolio_items()
-        for item in db_items:
-            price_data = {
+        self.tracker.storage_manager.sync_portfolio_items(items)
+
+        # Add price data for all items as one batched write
+        stored_items = self.tracker.storage_manager.get_portfolio_items()
+        rows = [
+            (item['id'], item['name'], {
                 'status': 'success',
                 'from_price': 15.00,
                 'available_items': 50
-            }
-            self.tracker.db_manager.save_price_data(item.id, price_data)
-        
+            })
+            for item in stored_items
+        ]
+        self.tracker.storage_manager.save_price_data_batch(rows)
+
         # Get summary
         summary = self.tracker.get_portfolio_summary()
         
@@ -190,5 +185,66 @@ class TestPortfolioTracker(unittest.TestCase):
         self.assertEqual(item_summary['current_price'], 15.00)
 
 
+class TestPortfolioTrackerAsync(unittest.IsolatedAsyncioTestCase):
+    """Async test cases for PortfolioTracker
+
+    Kept separate from TestPortfolioTracker: under a plain TestCase an
+    async test method returns an un-awaited coroutine and silently never
+    runs, so the async path needs IsolatedAsyncioTestCase.
+    """
+
+    def setUp(self):
+        """Set up a temporary working directory"""
+        self._work_dir = tempfile.TemporaryDirectory()
+        self.data_dir = str(Path(self._work_dir.name) / 'data')
+        self.temp_csv_path = str(Path(self._work_dir.name) / 'portfolio.csv')
+
+    def tearDown(self):
+        """Clean up the per-test working directory"""
+        self._work_dir.cleanup()
+
+    async def test_track_all_items(self):
+        """Test tracking all items"""
+        # Swap in plain fakes instead of MagicMock dependencies
+        fake_storage = FakeStorageManager()
+        fake_scraper = FakeScraper()
+
+        tracker = PortfolioTracker(
+            data_dir=self.data_dir,
+            csv_path=self.temp_csv_path
+        )
+        tracker.storage_manager = fake_storage
+        tracker.scraper = fake_scraper
+        tracker.load_portfolio_from_csv = lambda: [
+            {
+                'link': 'https://example.com/card1',
+                'name': 'Test Card 1',
+                'quantity': 1,
+                'purchase_price': 10.00
+            }
+        ]
+
+        # Track items
+        await tracker.track_all_items()
+
+        # Verify the scraper was driven by the stored item's link
+        self.assertEqual(fake_scraper.scraped, ['https://example.com/card1'])
+
+        # Verify the storage calls in order
+        call_names = [name for name, _ in fake_storage.calls]
+        self.assertEqual(
+            call_names,
+            ['sync_portfolio_items', 'get_portfolio_items', 'save_price_data_batch']
+        )
+
+        # Verify the persisted batch carries the scraped price data
+        batch = fake_storage.calls[-1][1]
+        self.assertEqual(len(batch), 1)
+        item_id, item_name, price_data = batch[0]
+        self.assertEqual(item_id, 1)
+        self.assertEqual(item_name, 'Test Card 1')
+        self.assertEqual(price_data['from_price'], 12.50)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file